@@ -0,0 +1,130 @@
+from manim import *
+from fractions import Fraction
+
+from gaussian_solver import to_latex
+from tex_cache import cached_mathtex
+
+# Augmented matrix [A | b] with individually addressable cells.
+# Every entry is its own MathTex, compiled once per (value, font size) and
+# shared through the tex cache. Row operations return animations for the
+# entries that actually change; those cells morph in place, so the matrix
+# stays one mobject in the scene and nothing else is rebuilt or cross-faded.
+
+
+def matrix_cell(value, font_size):
+    return cached_mathtex(to_latex(value), font_size=font_size)
+
+
+class AugmentedMatrix(VGroup):
+    def __init__(self, rows, font_size=65, size_for=None, **kwargs):
+        super().__init__(**kwargs)
+        self.values = [[Fraction(value) for value in row] for row in rows]
+        self.font_size = font_size
+        self.n_rows, self.n_cols = len(rows), len(rows[0])
+        self._layout(size_for or [rows])
+
+        # cells[r][c] is entry (r, c)
+        self.cells = VGroup(*[
+            VGroup(*[self._new_cell(r, c, value) for c, value in enumerate(row)])
+            for r, row in enumerate(self.values)
+        ])
+        self.brackets = VGroup(self._bracket(-1), self._bracket(1))
+        self.divider = Line(
+            np.array([self.divider_x, self.half_height - 0.1, 0]),
+            np.array([self.divider_x, -self.half_height + 0.1, 0]),
+            stroke_width=3
+        )
+        self.add(self.cells, self.brackets, self.divider)
+
+    @staticmethod
+    def fit_font_size(matrices, font_size=65, max_width=8.4):
+        # Largest font size (up to font_size) at which all matrices fit max_width
+        width = AugmentedMatrix(matrices[0], font_size, size_for=matrices).brackets.width
+        return font_size if width <= max_width else int(font_size * max_width / width)
+
+    # --- Layout ---
+
+    def _layout(self, matrices):
+        # Column widths cover every matrix in size_for, so columns don't jump
+        # between steps of an elimination
+        scale = self.font_size / 65
+        widths = [
+            max(matrix_cell(m[r][c], self.font_size).width for m in matrices for r in range(self.n_rows))
+            for c in range(self.n_cols)
+        ]
+        gaps = [0.55 * scale] * (self.n_cols - 2) + [0.9 * scale]
+
+        xs, x = [], 0
+        for c in range(self.n_cols):
+            xs.append(x + widths[c] / 2)
+            x += widths[c] + (gaps[c] if c < self.n_cols - 1 else 0)
+        self.xs = [v - x / 2 for v in xs]
+
+        row_step = 0.85 * scale
+        self.ys = [((self.n_rows - 1) / 2 - r) * row_step for r in range(self.n_rows)]
+        # Divider between the coefficients and the right-hand side
+        self.divider_x = self.xs[-1] - widths[-1] / 2 - gaps[-1] / 2
+        self.half_width = x / 2 + 0.3 * scale
+        self.half_height = (self.n_rows * row_step) / 2 + 0.1 * scale
+        self.serif = 0.2 * scale
+
+    def _bracket(self, side):
+        x = side * self.half_width
+        return VMobject(stroke_width=3).set_points_as_corners([
+            np.array([x - side * self.serif, self.half_height, 0]),
+            np.array([x, self.half_height, 0]),
+            np.array([x, -self.half_height, 0]),
+            np.array([x - side * self.serif, -self.half_height, 0]),
+        ])
+
+    def grid_center(self):
+        # Brackets are symmetric about the grid origin wherever the matrix moves
+        return self.brackets.get_center()
+
+    def cell_position(self, r, c):
+        return self.grid_center() + np.array([self.xs[c], self.ys[r], 0])
+
+    def row_y(self, r):
+        return self.grid_center()[1] + self.ys[r]
+
+    def _new_cell(self, r, c, value):
+        # Built centered on the origin, before the matrix is moved anywhere
+        return matrix_cell(value, self.font_size).move_to(np.array([self.xs[c], self.ys[r], 0]))
+
+    # --- Access ---
+
+    def get_cell(self, r, c):
+        return self.cells[r][c]
+
+    def get_row(self, r):
+        return self.cells[r]
+
+    def get_entries(self):
+        return VGroup(*[cell for row in self.cells for cell in row])
+
+    # --- Row operations ---
+
+    def set_row(self, r, values):
+        # Animations that morph only the entries of row r whose value changes
+        animations = []
+        for c, value in enumerate(values):
+            value = Fraction(value)
+            if value != self.values[r][c]:
+                target = matrix_cell(value, self.font_size).move_to(self.cell_position(r, c))
+                animations.append(Transform(self.cells[r][c], target))
+                self.values[r][c] = value
+        return animations
+
+    def swap_rows(self, a, b):
+        # Rows trade places, nothing is recompiled
+        row_a, row_b = self.cells[a], self.cells[b]
+        animations = [row_a.animate.set_y(self.row_y(b)), row_b.animate.set_y(self.row_y(a))]
+        self.cells.submobjects[a], self.cells.submobjects[b] = row_b, row_a
+        self.values[a], self.values[b] = self.values[b], self.values[a]
+        return animations
+
+    def apply_row_op(self, op):
+        # Animations taking the matrix to the state after a gaussian_solver.RowOp
+        if op.kind == "swap":
+            return self.swap_rows(op.target, op.source)
+        return self.set_row(op.target, op.matrix[op.target])
@@ -0,0 +1,180 @@
+import argparse
+import importlib
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from render_all import discover_scenes
+from render_options import parse_values
+
+# Benchmark harness for every scene in the project.
+# Each (scene, resolution, frame rate) runs in a fresh interpreter, renders
+# without the partial movie cache into a throwaway media dir and reports
+# frames per second, time to first frame (from process launch) and peak RSS.
+# With --skip-encoding frames are computed and rasterized but never handed
+# to ffmpeg. Results are appended to a JSON lines history; a run more than
+# --threshold percent worse than the median of the last --window matching
+# runs is flagged and the exit status is 1.
+#
+#   python bench_scenes.py --scale 0.25,0.5 --fps 30
+#   python bench_scenes.py --skip-encoding integration_scanner:IntegrationScannerSin
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY = os.path.join(PROJECT_DIR, "media", "bench", "bench_history.jsonl")
+# Metric -> whether a larger value is better
+METRICS = {"render_fps": True, "time_to_first_frame": False, "peak_rss_mb": False}
+
+
+def run_child(module_name, scene_name, scale, fps, skip_encoding, launched):
+    # Runs in the benchmark subprocess
+    sys.path.insert(0, PROJECT_DIR)
+    from manim import config, tempconfig
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    scene_class = getattr(importlib.import_module(module_name), scene_name)
+    imported = time.time()
+
+    frame_times = []
+    write_frame = SceneFileWriter.write_frame
+
+    def timed_write_frame(writer, *args, **kwargs):
+        frame_times.append(time.time())
+        return write_frame(writer, *args, **kwargs)
+
+    SceneFileWriter.write_frame = timed_write_frame
+    # Scenes set their own pixel size on import; scale that, kept even for yuv420p
+    width, height = (2 * round(size * scale / 2) for size in (config.pixel_width, config.pixel_height))
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+        "pixel_width": width, "pixel_height": height, "frame_rate": fps or config.frame_rate,
+        "write_to_movie": not skip_encoding, "disable_caching": True, "media_dir": media_dir,
+    }):
+        frame_rate = config.frame_rate
+        start = time.time()
+        scene_class().render()
+        end = time.time()
+
+    return {
+        "width": width,
+        "height": height,
+        "fps": frame_rate,
+        "frames": len(frame_times),
+        "render_time": end - start,
+        "render_fps": len(frame_times) / (end - start),
+        "import_time": imported - launched,
+        "time_to_first_frame": frame_times[0] - launched if frame_times else None,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "encoder_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def benchmark(module, scene, scale, fps, skip_encoding, timeout):
+    cmd = [
+        sys.executable, __file__, "--child", module, scene, str(scale), str(fps or 0),
+        str(int(skip_encoding)), repr(time.time()),
+    ]
+    try:
+        done = subprocess.run(cmd, cwd=PROJECT_DIR, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"ok": False, "error": f"timed out after {timeout}s"}
+    lines = [line for line in done.stdout.splitlines() if line.startswith("BENCH ")]
+    if done.returncode != 0 or not lines:
+        return {"ok": False, "error": done.stderr.strip().splitlines()[-1] if done.stderr.strip() else f"exit {done.returncode}"}
+    return {"ok": True, **json.loads(lines[-1][len("BENCH "):])}
+
+
+def bench_key(result):
+    mode = "compute" if result["skip_encoding"] else "full"
+    return f"{result['scene']}@{result['width']}x{result['height']}@{result['fps']}fps/{mode}"
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_regressions(result, history, threshold, window):
+    previous = [entry for entry in history if entry["key"] == result["key"]][-window:]
+    regressions = []
+    for metric, higher_is_better in METRICS.items():
+        values = [entry[metric] for entry in previous if entry.get(metric)]
+        if not values or not result.get(metric):
+            continue
+        baseline = statistics.median(values)
+        change = (result[metric] - baseline) / baseline
+        if (-change if higher_is_better else change) * 100 > threshold:
+            regressions.append(f"{metric} {baseline:.3g} -> {result[metric]:.3g} ({change:+.0%})")
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scene renders and track regressions.")
+    parser.add_argument("scenes", nargs="*", help="module:Scene pairs (default: all discovered scenes)")
+    parser.add_argument("--scale", type=parse_values, default=[0.25], help="fractions of each scene's pixel size")
+    parser.add_argument("--fps", type=parse_values, default=[0], help="frame rates (0: the scene's own)")
+    parser.add_argument("--skip-encoding", action="store_true", help="render frames without writing a movie")
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--threshold", type=float, default=10, help="percent worse than the median that counts as a regression")
+    parser.add_argument("--window", type=int, default=5, help="previous runs the median is taken over")
+    parser.add_argument("--no-record", action="store_true", help="compare against the history without appending to it")
+    parser.add_argument("--timeout", type=float, default=1800)
+    parser.add_argument("--child", nargs=6, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        module, scene, scale, fps, skip_encoding, launched = args.child
+        result = run_child(module, scene, float(scale), int(float(fps)), skip_encoding == "1", float(launched))
+        print("BENCH " + json.dumps(result))
+        return
+
+    scenes = [tuple(s.split(":")) for s in args.scenes] or discover_scenes()
+    history = load_history(args.history)
+    revision = git_revision()
+    failed = regressed = 0
+    for module, scene in scenes:
+        for scale in args.scale:
+            for fps in args.fps:
+                result = benchmark(module, scene, scale, int(fps), args.skip_encoding, args.timeout)
+                result.update(scene=scene, module=module, scale=scale, skip_encoding=args.skip_encoding)
+                if not result["ok"]:
+                    failed += 1
+                    print(f"{scene:32s} FAILED  {result['error']}")
+                    continue
+
+                result.update(key=bench_key(result), time=time.time(), revision=revision)
+                regressions = find_regressions(result, history, args.threshold, args.window)
+                regressed += bool(regressions)
+                ttff = result["time_to_first_frame"]
+                print(
+                    f"{result['key']:56s} {result['render_fps']:7.1f} fps"
+                    f"  first frame {ttff if ttff is not None else float('nan'):6.2f}s  {result['peak_rss_mb']:6.0f} MB"
+                    + "".join(f"\n    REGRESSION {line}" for line in regressions)
+                )
+                if not args.no_record:
+                    os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+                    with open(args.history, "a") as f:
+                        f.write(json.dumps(result) + "\n")
+                history.append(result)
+
+    if regressed:
+        print(f"{regressed} benchmark(s) regressed by more than {args.threshold:g}%")
+    sys.exit(1 if failed or regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
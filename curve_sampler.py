@@ -0,0 +1,117 @@
+from manim import *
+import numpy as np
+
+from scan_engine import axes_to_scene, axes_units, evaluate
+
+# Curvature-adaptive sampling for the scanner reel graphs.
+# Axes.plot samples uniformly (10 points per tick), which wastes points on
+# flat stretches and can undersample tight bends. Here intervals are halved
+# only where the curve's midpoint is farther from the chord than a pixel
+# tolerance, so straight parts keep a few samples and bends get what they
+# need (sin on [-4, 6.5] in the integration reel: 72 samples at 0.5 px,
+# Axes.plot uses 106). The samples are kept per (function, range, axes
+# placement, pixel density) and shared by the plotted curve and the areas
+# under it.
+#
+# The plotted curve gets smooth cubic handles through the samples like
+# Axes.plot (about half the chord error for smooth functions); segments
+# where that would miss the function, at kinks and jumps, stay straight.
+# Areas use the straight polyline, within the tolerance of the curve.
+
+
+def pixels_per_unit():
+    return config.pixel_width / config.frame_width
+
+
+def adaptive_samples(func, c2p, x_min, x_max, tolerance_px=0.5, scale=None, initial=16, max_depth=12):
+    # Sorted xs, f(xs) and scene points. Each level evaluates the midpoints
+    # of all intervals still being refined in one batch.
+    scale = scale or pixels_per_unit()
+    xs = np.linspace(x_min, x_max, initial + 1)
+    ys = evaluate(func, xs)
+    points = c2p(xs, ys)
+    active = np.arange(initial)
+
+    for _ in range(max_depth):
+        if not len(active):
+            break
+        mid_xs = (xs[active] + xs[active + 1]) / 2
+        mid_ys = evaluate(func, mid_xs)
+        mids = c2p(mid_xs, mid_ys)
+        error = np.linalg.norm(mids - (points[active] + points[active + 1]) / 2, axis=1) * scale
+        refine = error > tolerance_px
+        split = active[refine]
+
+        xs = np.insert(xs, split + 1, mid_xs[refine])
+        ys = np.insert(ys, split + 1, mid_ys[refine])
+        points = np.insert(points, split + 1, mids[refine], axis=0)
+        # Interval split[k] moved right by k, its two halves stay active
+        shifted = split + np.arange(len(split))
+        active = np.sort(np.concatenate([shifted, shifted + 1]))
+    return xs, ys, points
+
+
+def smooth_handles(func, c2p, xs, ys, points, tolerance_px=0.5, scale=None):
+    # Cubic Hermite handles, slopes from the samples (np.gradient takes the
+    # uneven spacing into account). c2p is affine, so handles map directly
+    scale = scale or pixels_per_unit()
+    slopes = np.gradient(ys, xs)
+    h = np.diff(xs)
+    handles1 = c2p(xs[:-1] + h / 3, ys[:-1] + slopes[:-1] * h / 3)
+    handles2 = c2p(xs[1:] - h / 3, ys[1:] - slopes[1:] * h / 3)
+
+    # Bezier midpoint against the function, one batch
+    mid_xs = (xs[:-1] + xs[1:]) / 2
+    smooth_mids = (points[:-1] + points[1:]) / 8 + 3 * (handles1 + handles2) / 8
+    missed = np.linalg.norm(smooth_mids - c2p(mid_xs, evaluate(func, mid_xs)), axis=1) * scale > tolerance_px
+    chords = points[1:] - points[:-1]
+    handles1[missed] = points[:-1][missed] + chords[missed] / 3
+    handles2[missed] = points[1:][missed] - chords[missed] / 3
+    return handles1, handles2
+
+
+class SampledCurve:
+    # Shared samples, by (func, x range, axes placement, pixel density, tolerance)
+    _cache = {}
+
+    def __init__(self, axes, func, x_range, tolerance_px=0.5):
+        self.func = func
+        self.c2p = axes_to_scene(axes)
+        self.xs, self.ys, self.points = adaptive_samples(func, self.c2p, x_range[0], x_range[1], tolerance_px)
+        self.handles = smooth_handles(func, self.c2p, self.xs, self.ys, self.points, tolerance_px)
+
+    @classmethod
+    def get(cls, axes, func, x_range, tolerance_px=0.5):
+        origin, x_unit, y_unit = axes_units(axes)
+        key = (
+            func, float(x_range[0]), float(x_range[1]), tolerance_px, pixels_per_unit(),
+            tuple(np.round(np.concatenate([origin, x_unit, y_unit]), 9)),
+        )
+        if key not in cls._cache:
+            cls._cache[key] = cls(axes, func, x_range, tolerance_px)
+        return cls._cache[key]
+
+    def __len__(self):
+        return len(self.xs)
+
+    def value(self, x):
+        # Height of the sampled polyline, within tolerance of func
+        return np.interp(x, self.xs, self.ys)
+
+    def point(self, x):
+        return self.c2p(x, self.value(x))
+
+
+def adaptive_plot(axes, func, x_range=None, tolerance_px=0.5, smooth=True, **kwargs):
+    # Stand-in for axes.plot: a curve through the adaptive samples (smooth,
+    # or a polyline), which are kept on it as .samples for areas and other
+    # consumers
+    x_range = x_range or axes.x_range[:2]
+    samples = SampledCurve.get(axes, func, x_range, tolerance_px)
+    curve = VMobject(**kwargs)
+    if smooth:
+        curve.set_anchors_and_handles(samples.points[:-1], *samples.handles, samples.points[1:])
+    else:
+        curve.set_points_as_corners(samples.points)
+    curve.samples = samples
+    return curve
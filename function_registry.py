@@ -0,0 +1,178 @@
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+# Symbolic functions for the scanner reels.
+# A scene declares f once as an expression string. The registry derives f'
+# and F with sympy, produces the LaTeX for the labels and prints each
+# expression as NumPy code, so evaluation is one vectorized call per batch.
+# Everything derived is cached on disk by a hash of the expression, the
+# sympy version and the printer; a warm render loads the cached code and
+# never imports or runs sympy (which is only imported on a cache miss, it
+# adds most of a second to startup).
+
+CACHE_DIR = os.environ.get(
+    "REEL_FUNCTION_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "think_nebulae", "functions")
+)
+
+
+def _sympy():
+    try:
+        import sympy
+    except ImportError:
+        raise ImportError(
+            "sympy is needed to compile expressions (pip install sympy), it's only "
+            "imported when an expression isn't cached yet"
+        ) from None
+    return sympy
+
+
+@lru_cache(maxsize=None)
+def _toolchain():
+    # What the cached code depends on, read without importing sympy or scipy
+    try:
+        version = importlib.metadata.version("sympy")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    return version, "scipy" if importlib.util.find_spec("scipy") else "numpy"
+
+
+def _numpy_code(expr):
+    # Code and the modules it uses. Special functions come from scipy.special
+    # when SciPy is installed; NumPyPrinter prints scalar math.* ones instead
+    # (math.erf, math.gamma), see _compile
+    from sympy.printing.numpy import NumPyPrinter, SciPyPrinter
+
+    printer = SciPyPrinter() if _toolchain()[1] == "scipy" else NumPyPrinter()
+    try:
+        code = printer.doprint(expr)
+    except NotImplementedError:
+        raise ValueError(f"{expr} can't be evaluated with {_toolchain()[1]}") from None
+    return code, sorted(printer.module_imports)
+
+
+def _compile(code, modules, variable):
+    namespace = {}
+    for module in ["numpy", *modules]:
+        importlib.import_module(module)
+        namespace[module.split(".")[0]] = importlib.import_module(module.split(".")[0])
+    exec(f"def evaluate({variable}):\n    return {code}\n", namespace)
+    if "math" in modules:
+        # Scalar math.* functions, evaluated element by element
+        return np.vectorize(namespace["evaluate"], otypes=[float])
+    return namespace["evaluate"]
+
+
+class ScanFunction:
+    def __init__(self, registry, key, entry):
+        self.registry = registry
+        self.key = key
+        self.entry = entry
+        self.expression = entry["expression"]
+        self.variable = entry["variable"]
+        self._evaluate = _compile(entry["numpy"], entry["modules"], self.variable)
+
+    def __call__(self, x):
+        y = np.asarray(self._evaluate(np.asarray(x, dtype=float)), dtype=float)
+        if np.ndim(x) == 0:
+            return float(y)
+        # Constant expressions evaluate to a scalar whatever x is
+        return np.broadcast_to(y, np.shape(x)).copy()
+
+    def __repr__(self):
+        return f"ScanFunction({self.expression!r})"
+
+    @property
+    def latex(self):
+        return self.entry["latex"]
+
+    def label(self, name="f"):
+        return f"{name}({self.variable}) = {self.latex}"
+
+    def derivative(self):
+        return self.registry.derived(self, "derivative")
+
+    def antiderivative(self):
+        # Without integration constant
+        return self.registry.derived(self, "antiderivative")
+
+
+class FunctionRegistry:
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        # ScanFunctions already loaded in this process
+        self._memory = {}
+
+    def key(self, expression, variable):
+        return hashlib.sha256(json.dumps([expression, variable, *_toolchain()]).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def _load(self, key):
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _store(self, key, entry):
+        # Atomic write, parallel renders may store the same entry at once
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+    def _parse(self, expression, variable):
+        sympy = _sympy()
+        # Real, so |x|' is sign(x) rather than re/im terms nothing can print
+        return sympy.sympify(expression, locals={variable: sympy.Symbol(variable, real=True)})
+
+    def function(self, expression, variable="x"):
+        expression = str(expression).strip()
+        key = self.key(expression, variable)
+        if key not in self._memory:
+            entry = self._load(key)
+            if entry is None:
+                expr = self._parse(expression, variable)
+                code, modules = _numpy_code(expr)
+                entry = {
+                    "expression": expression,
+                    "variable": variable,
+                    "latex": _sympy().latex(expr),
+                    "numpy": code,
+                    "modules": modules,
+                }
+                self._store(key, entry)
+            self._memory[key] = ScanFunction(self, key, entry)
+        return self._memory[key]
+
+    def derived(self, function, kind):
+        # kind is "derivative" or "antiderivative"; the result's expression
+        # is kept in the parent's entry
+        entry = function.entry
+        if kind not in entry:
+            expr = self._parse(function.expression, function.variable)
+            sympy = _sympy()
+            x = sympy.Symbol(function.variable, real=True)
+            result = sympy.diff(expr, x) if kind == "derivative" else sympy.integrate(expr, x)
+            if result.has(sympy.Integral, sympy.Derivative):
+                raise ValueError(f"{function.expression!r} has no closed-form {kind}")
+            entry[kind] = str(result)
+            self._store(function.key, entry)
+        return self.function(entry[kind], function.variable)
+
+
+function_registry = FunctionRegistry()
+
+
+def scan_function(expression, variable="x"):
+    return function_registry.function(expression, variable)
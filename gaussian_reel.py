@@ -1,23 +1,55 @@
 from manim import *
 
-# --- Instagram Reel Config (9:16) ---
-config.pixel_width = 1080
-config.pixel_height = 1920
-config.frame_width = 9.0
-config.frame_height = 16.0
+from augmented_matrix import AugmentedMatrix
+from gaussian_solver import back_substitute, eliminate, to_latex, variable_names
+from reel_template import ReelScene
+from tex_cache import cached_mathtex, cached_tex, cached_text
+
+# Row-op text color per pivot column
+OP_COLORS = [YELLOW, ORANGE, PINK, PURPLE, TEAL]
+MAX_WIDTH = 8.4
+
+
+def equation_parts(row, names):
+    # MathTex parts of one equation and, per matrix entry, the parts that
+    # turn into that entry (a minus sign travels with its coefficient)
+    parts, keep = [to_latex(row[0]), names[0]], [[0]]
+    for value, name in zip(row[1:-1], names[1:]):
+        parts += ["-" if value < 0 else "+", to_latex(abs(value)), name]
+        keep.append([len(parts) - 2] if value >= 0 else [len(parts) - 3, len(parts) - 2])
+    parts += ["=", to_latex(row[-1])]
+    keep.append([len(parts) - 1])
+    return parts, keep
+
+
+def fit_width(mob, width=MAX_WIDTH):
+    if mob.width > width:
+        mob.scale_to_fit_width(width)
+    return mob
+
+
+class GaussianEliminationReel(ReelScene):
+    # Augmented matrix [A | b] of the system to solve
+    system = None
+    partial_pivot = True
 
-class GaussianEliminationFinal(Scene):
     def construct(self):
+        n = len(self.system)
+        names = variable_names(n)
+        ops, triangular = eliminate(self.system, partial_pivot=self.partial_pivot)
+        steps, _ = back_substitute(triangular, names)
+
         # ---------------------------------------------
         # 1. PERMANENT HEADER
         # ---------------------------------------------
-        header = Text("Gaussian Elimination", font_size=50, color=BLUE).to_edge(UP, buff=1.0)
-        self.add(header)
+        header = cached_text("Gaussian Elimination", font_size=50, color=BLUE).to_edge(UP, buff=1.0)
+        self.add_static(header)
 
         # ---------------------------------------------
         # 2. INTRO
         # ---------------------------------------------
-        goal_text = Tex(r"Find values for \textbf{x}, \textbf{y}, \textbf{z}", font_size=50).next_to(header, DOWN, buff=1.0)
+        bold_names = ", ".join(rf"\textbf{{{name}}}" if n <= 3 else f"${name}$" for name in names)
+        goal_text = fit_width(cached_tex(f"Find values for {bold_names}", font_size=50)).next_to(header, DOWN, buff=1.0)
         self.play(Write(goal_text))
         self.wait(1)
         self.play(FadeOut(goal_text))
@@ -25,202 +57,148 @@ class GaussianEliminationFinal(Scene):
         # ---------------------------------------------
         # 3. SYSTEM & TRANSITION
         # ---------------------------------------------
-        eq1 = MathTex("1", "x", "+", "1", "y", "+", "1", "z", "=", "6", font_size=55)
-        eq2 = MathTex("2", "x", "+", "3", "y", "+", "1", "z", "=", "11", font_size=55)
-        eq3 = MathTex("3", "x", "+", "1", "y", "+", "2", "z", "=", "11", font_size=55)
-        
-        equations = VGroup(eq1, eq2, eq3).arrange(DOWN, aligned_edge=LEFT, buff=0.4).shift(UP * 2)
+        equations, keeps = VGroup(), []
+        for row in self.system:
+            parts, keep = equation_parts(row, names)
+            equations.add(cached_mathtex(*parts, font_size=55))
+            keeps.append(keep)
+        equations.arrange(DOWN, aligned_edge=LEFT, buff=0.4).shift(UP * 2)
+        fit_width(equations)
         self.play(Write(equations), run_time=1.5)
         self.wait(0.5)
 
         # Split fade/keep groups
-        vars_to_fade = VGroup(
-            eq1[1], eq1[2], eq1[4], eq1[5], eq1[7], eq1[8], 
-            eq2[1], eq2[2], eq2[4], eq2[5], eq2[7], eq2[8],
-            eq3[1], eq3[2], eq3[4], eq3[5], eq3[7], eq3[8]
-        )
-        numbers_to_keep = VGroup(
-            eq1[0], eq1[3], eq1[6], eq1[9],
-            eq2[0], eq2[3], eq2[6], eq2[9],
-            eq3[0], eq3[3], eq3[6], eq3[9]
-        )
-        
+        numbers_to_keep = VGroup(*[
+            VGroup(*[eq[i] for i in indices]) for eq, keep in zip(equations, keeps) for indices in keep
+        ])
+        vars_to_fade = VGroup()
+        for eq, keep in zip(equations, keeps):
+            kept = {i for indices in keep for i in indices}
+            vars_to_fade.add(*[part for i, part in enumerate(eq) if i not in kept])
+
         # Evacuate
         self.play(FadeOut(vars_to_fade, shift=UP*0.5), run_time=1)
-        
-        # Form Matrix
-        matrix = MathTex(
-            r"\left[\begin{array}{ccc|c}"
-            r"1 & 1 & 1 & 6 \\"
-            r"2 & 3 & 1 & 11 \\"
-            r"3 & 1 & 2 & 11"
-            r"\end{array}\right]",
-            font_size=65
-        ).move_to(equations)
-
-        self.play(ReplacementTransform(numbers_to_keep, matrix), run_time=1.5)
+
+        # Form Matrix, sized for every step of the elimination
+        matrices = [self.system] + [op.matrix for op in ops]
+        font_size = AugmentedMatrix.fit_font_size(matrices, max_width=MAX_WIDTH)
+        matrix = AugmentedMatrix(self.system, font_size, size_for=matrices).move_to(equations)
+
+        self.play(
+            *[ReplacementTransform(kept, cell) for kept, cell in zip(numbers_to_keep, matrix.get_entries())],
+            FadeIn(matrix.brackets),
+            FadeIn(matrix.divider),
+            run_time=1.5
+        )
+        # One matrix mobject from here on
+        self.add(matrix)
         self.wait(1)
 
         # Move Matrix UP
         self.play(matrix.animate.shift(UP * 1.5))
 
         # ---------------------------------------------
-        # 4. ROW OPERATIONS (FIXED ARROW)
+        # 4. ROW OPERATIONS
         # ---------------------------------------------
-        
-        # --- Arrow Setup ---
-        arrow = Arrow(start=LEFT, end=RIGHT, color=RED).scale(1.2)
-        # Positioned nicely at Row 2
-        arrow.next_to(matrix, LEFT, buff=0.4).shift(UP * 0.1) 
-
-        # --- Op 1: R2 = R2 - 2R1 ---
-        op1_text = MathTex(r"R_2 \leftarrow R_2 - 2R_1", font_size=40, color=YELLOW).next_to(matrix, DOWN, buff=0.8)
-        
-        self.play(GrowArrow(arrow), Write(op1_text))
-        
-        matrix_step1 = MathTex(
-            r"\left[\begin{array}{ccc|c}"
-            r"1 & 1 & 1 & 6 \\"
-            r"0 & 1 & -1 & -1 \\"
-            r"3 & 1 & 2 & 11"
-            r"\end{array}\right]",
-            font_size=65
-        ).move_to(matrix)
-        
-        self.play(FadeOut(matrix), FadeIn(matrix_step1), run_time=1)
-        matrix = matrix_step1 
-        self.wait(0.5)
-
-        # --- Op 2: R3 = R3 - 3R1 ---
-        op2_text = MathTex(r"R_3 \leftarrow R_3 - 3R_1", font_size=40, color=YELLOW).move_to(op1_text)
-        
-        # Fixed Arrow Movement (0.85 units down)
-        self.play(
-            ReplacementTransform(op1_text, op2_text),
-            arrow.animate.shift(DOWN * 0.85) 
-        )
-
-        matrix_step2 = MathTex(
-            r"\left[\begin{array}{ccc|c}"
-            r"1 & 1 & 1 & 6 \\"
-            r"0 & 1 & -1 & -1 \\"
-            r"0 & -2 & -1 & -7"
-            r"\end{array}\right]",
-            font_size=65
-        ).move_to(matrix)
-        
-        self.play(FadeOut(matrix), FadeIn(matrix_step2), run_time=1)
-        matrix = matrix_step2
-        self.wait(0.5)
-
-        # --- Op 3: R3 = R3 + 2R2 ---
-        op3_text = MathTex(r"R_3 \leftarrow R_3 + 2R_2", font_size=40, color=ORANGE).move_to(op1_text)
-        
-        self.play(
-            ReplacementTransform(op2_text, op3_text),
-            Indicate(arrow, color=ORANGE) 
-        )
-
-        matrix_final = MathTex(
-            r"\left[\begin{array}{ccc|c}"
-            r"1 & 1 & 1 & 6 \\"
-            r"0 & 1 & -1 & -1 \\"
-            r"0 & 0 & -3 & -9"
-            r"\end{array}\right]",
-            font_size=65
-        ).move_to(matrix)
-
-        self.play(FadeOut(matrix), FadeIn(matrix_final), run_time=1)
-        matrix = matrix_final
-        
-        self.play(FadeOut(op3_text), FadeOut(arrow))
+        if ops:
+            arrow = Arrow(start=LEFT, end=RIGHT, color=RED).scale(1.2)
+            arrow.next_to(matrix, LEFT, buff=0.4).set_y(matrix.row_y(ops[0].target))
+            op_text = None
+
+        for i, op in enumerate(ops):
+            color = OP_COLORS[op.column % len(OP_COLORS)]
+            new_text = cached_mathtex(op.latex(), font_size=40, color=color)
+            row_y = matrix.row_y(op.target)
+
+            if op_text is None:
+                op_text = new_text.next_to(matrix, DOWN, buff=0.8)
+                self.play(GrowArrow(arrow), Write(op_text))
+            else:
+                new_text.move_to(op_text)
+                same_row = abs(arrow.get_y() - row_y) < 1e-3
+                self.play(
+                    ReplacementTransform(op_text, new_text),
+                    Indicate(arrow, color=color) if same_row else arrow.animate.set_y(row_y)
+                )
+                op_text = new_text
+
+            # Swapped rows slide, changed entries morph, the rest stay put
+            changes = matrix.apply_row_op(op)
+            if changes:
+                self.play(*changes, run_time=1)
+            if i < len(ops) - 1:
+                self.wait(0.5)
+
+        if ops:
+            self.play(FadeOut(op_text), FadeOut(arrow))
 
         # Triangle Result
-        p_corner = matrix.get_corner(DL) + UP*0.2 + RIGHT*0.4
-        triangle = Polygon(
-            p_corner, 
-            p_corner + UP*1.3, 
-            p_corner + RIGHT*1.7, 
-            color=GREEN, stroke_width=6
-        )
-        self.play(Create(triangle))
-        self.wait(0.5)
-        self.play(FadeOut(triangle))
+        if n > 1:
+            pad = 0.25 * font_size / 65
+            triangle = Polygon(
+                matrix.cell_position(1, 0) + (UP + LEFT) * pad,
+                matrix.cell_position(n - 1, 0) + (DOWN + LEFT) * pad,
+                matrix.cell_position(n - 1, n - 2) + (DOWN + RIGHT) * pad,
+                color=GREEN, stroke_width=6
+            )
+            self.play(Create(triangle))
+            self.wait(0.5)
+            self.play(FadeOut(triangle))
 
         # ---------------------------------------------
-        # 5. SUBSTITUTION (POSITIONS ADJUSTED)
+        # 5. SUBSTITUTION
         # ---------------------------------------------
-        
-        # Solve Z
-        eq_z = MathTex("-3", "z", "=", "-9", font_size=55).next_to(matrix, DOWN, buff=0.8)
-        self.play(Write(eq_z))
-        
-        ans_z = MathTex("z", "=", "3", font_size=55, color=GREEN).move_to(eq_z)
-        self.play(TransformMatchingShapes(eq_z, ans_z))
-        
-        # --- POSITION FIX: Move to (DOWN * 1.0) instead of bottom edge ---
-        self.play(ans_z.animate.move_to(DOWN * 1.0 + LEFT * 2.5))
-        
-        # Solve Y
-        eq_y_raw = MathTex("y", "-", "1", "z", "=", "-1", font_size=55).next_to(matrix, DOWN, buff=0.8)
-        self.play(Write(eq_y_raw))
-        self.wait(0.5)
-        
-        z_copy = ans_z[2].copy()
-        eq_y_sub = MathTex("y", "-", "1", "(3)", "=", "-1", font_size=55).move_to(eq_y_raw)
-        
-        self.play(
-            Transform(z_copy, eq_y_sub[3]), 
-            TransformMatchingShapes(eq_y_raw, eq_y_sub)
-        )
-        self.remove(z_copy)
-        
-        ans_y = MathTex("y", "=", "2", font_size=55, color=GREEN).move_to(eq_y_sub)
-        self.play(TransformMatchingShapes(eq_y_sub, ans_y))
-        
-        # Move Y next to Z (Automatically adheres to the higher position)
-        self.play(ans_y.animate.next_to(ans_z, RIGHT, buff=1))
-
-        # Solve X
-        eq_x_raw = MathTex("x", "+", "1", "y", "+", "1", "z", "=", "6", font_size=55).next_to(matrix, DOWN, buff=0.8)
-        self.play(Write(eq_x_raw))
-        
-        y_copy = ans_y[2].copy()
-        z_copy = ans_z[2].copy()
-        eq_x_sub = MathTex("x", "+", "1", "(2)", "+", "1", "(3)", "=", "6", font_size=55).move_to(eq_x_raw)
-        
-        self.play(
-            Transform(y_copy, eq_x_sub[3]),
-            Transform(z_copy, eq_x_sub[6]),
-            TransformMatchingShapes(eq_x_raw, eq_x_sub)
-        )
-        self.remove(y_copy, z_copy)
+        answers = {}
+        # Final positions: one row under the matrix, in the order solved
+        slots = VGroup(*[cached_mathtex(*step.answer_parts, font_size=55) for step in steps])
+        slots.arrange(RIGHT, buff=1)
+        if slots.width > MAX_WIDTH:
+            slots.arrange_in_grid(cols=3, buff=(1, 0.4))
+        slots.move_to(DOWN * 1.0)
+
+        for step, slot in zip(steps, slots):
+            eq_raw = fit_width(cached_mathtex(*step.raw_parts, font_size=55)).next_to(matrix, DOWN, buff=0.8)
+            self.play(Write(eq_raw))
+            current = eq_raw
+
+            if step.sub_parts:
+                self.wait(0.5)
+                eq_sub = fit_width(cached_mathtex(*step.sub_parts, font_size=55)).move_to(eq_raw)
+                copies = [answers[j][2].copy() for j in step.substituted]
+                self.play(
+                    *[Transform(copy, eq_sub[index]) for copy, index in zip(copies, step.substituted.values())],
+                    TransformMatchingShapes(eq_raw, eq_sub)
+                )
+                self.remove(*copies)
+                current = eq_sub
+
+            ans = cached_mathtex(*step.answer_parts, font_size=55, color=GREEN).move_to(current)
+            self.play(TransformMatchingShapes(current, ans))
+            self.play(ans.animate.move_to(slot))
+            answers[step.variable] = ans
 
-        ans_x = MathTex("x", "=", "1", font_size=55, color=GREEN).move_to(eq_x_sub)
-        self.play(TransformMatchingShapes(eq_x_sub, ans_x))
-        self.play(ans_x.animate.next_to(ans_y, RIGHT, buff=1))
-        
         # Final Box
-        final_group = VGroup(ans_z, ans_y, ans_x)
+        final_group = VGroup(*answers.values())
         box = SurroundingRectangle(final_group, color=YELLOW, buff=0.2)
-        label = Text("Solution", font_size=30).next_to(box, UP)
-        
+        label = cached_text("Solution", font_size=30).next_to(box, UP)
+
         self.play(Create(box), Write(label))
         self.wait(2)
 
         # ---------------------------------------------
         # 6. OUTRO ANIMATION
         # ---------------------------------------------
-        
         main_objects = VGroup(header, matrix, box, label, final_group)
         self.play(FadeOut(main_objects), run_time=1)
 
-        follow_text = Text("Follow for more!", font_size=50, weight=BOLD, gradient=(GREEN, BLUE))
-        sub_text = Text("@think_nebulae", font_size=30, color=GRAY).next_to(follow_text, DOWN)
+        self.play_outro(gradient=(GREEN, BLUE), wait_time=3)
 
-        self.play(
-            Write(follow_text),
-            FadeIn(sub_text, shift=UP),
-            run_time=2
-        )
-        self.wait(3)
\ No newline at end of file
+
+class GaussianEliminationFinal(GaussianEliminationReel):
+    system = [
+        [1, 1, 1, 6],
+        [2, 3, 1, 11],
+        [3, 1, 2, 11],
+    ]
+    # Keep the published row order (R2 - 2R1, R3 - 3R1, R3 + 2R2)
+    partial_pivot = False
@@ -0,0 +1,124 @@
+from fractions import Fraction
+
+# Exact Gaussian elimination for the elimination reels.
+# Works on an n x (n+1) augmented matrix of Fractions and records every row
+# operation and back-substitution step, together with the LaTeX the reel
+# needs to show it.
+
+
+def to_latex(value):
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    sign = "-" if value < 0 else ""
+    return rf"{sign}\frac{{{abs(value.numerator)}}}{{{value.denominator}}}"
+
+
+def _parenthesize(value):
+    latex = to_latex(value)
+    return f"({latex})" if Fraction(value).denominator == 1 else rf"\left({latex}\right)"
+
+
+def variable_names(n):
+    return ["x", "y", "z"][:n] if n <= 3 else [f"x_{{{i + 1}}}" for i in range(n)]
+
+
+class RowOp:
+    # kind "swap": rows target and source trade places
+    # kind "eliminate": R_target <- R_target - factor * R_source
+    def __init__(self, kind, target, source, column, matrix, factor=None):
+        self.kind = kind
+        self.target = target
+        self.source = source
+        # Pivot column being cleared
+        self.column = column
+        # Matrix after the operation
+        self.matrix = matrix
+        self.factor = factor
+
+    @property
+    def changed_rows(self):
+        return [self.target, self.source] if self.kind == "swap" else [self.target]
+
+    def latex(self):
+        target, source = f"R_{self.target + 1}", f"R_{self.source + 1}"
+        if self.kind == "swap":
+            return rf"{target} \leftrightarrow {source}"
+        sign = "-" if self.factor > 0 else "+"
+        factor = "" if abs(self.factor) == 1 else to_latex(abs(self.factor))
+        return rf"{target} \leftarrow {target} {sign} {factor}{source}"
+
+
+class BackSubstitution:
+    # Solving row `row` of the triangular system for variable `variable`,
+    # given the values already found. Each *_parts list is the MathTex
+    # substring list of one stage of the reel animation.
+    def __init__(self, row, variable, names, coefficients, rhs, known):
+        self.row = row
+        self.variable = variable
+        pivot = coefficients[variable]
+        self.value = (rhs - sum(coefficients[j] * known[j] for j in known)) / pivot
+
+        name = names[variable]
+        lead = [name] if pivot == 1 else [to_latex(pivot), name]
+        raw, sub = list(lead), list(lead)
+        # Part index in sub_parts where each known value is substituted
+        self.substituted = {}
+        for j in sorted(known):
+            if coefficients[j] == 0:
+                continue
+            sign = "-" if coefficients[j] < 0 else "+"
+            coefficient = to_latex(abs(coefficients[j]))
+            raw += [sign, coefficient, names[j]]
+            sub += [sign, coefficient]
+            self.substituted[j] = len(sub)
+            sub += [_parenthesize(known[j])]
+
+        tail = ["=", to_latex(rhs)]
+        self.raw_parts = raw + tail
+        self.sub_parts = sub + tail if self.substituted else None
+        self.answer_parts = [name, "=", to_latex(self.value)]
+
+
+def eliminate(matrix, partial_pivot=True):
+    # Forward elimination to upper-triangular form. With partial_pivot the
+    # largest remaining entry of each column becomes the pivot, otherwise
+    # rows are only swapped when the pivot is zero.
+    rows = [[Fraction(value) for value in row] for row in matrix]
+    n = len(rows)
+    if any(len(row) != n + 1 for row in rows):
+        raise ValueError(f"Expected an n x (n+1) augmented matrix, got {n} rows of lengths {[len(r) for r in rows]}")
+
+    ops = []
+    for column in range(n):
+        candidates = [r for r in range(column, n) if rows[r][column] != 0]
+        if not candidates:
+            raise ValueError("System has no unique solution")
+        if partial_pivot:
+            pivot = max(candidates, key=lambda r: abs(rows[r][column]))
+        else:
+            pivot = candidates[0]
+
+        if pivot != column:
+            rows[column], rows[pivot] = rows[pivot], rows[column]
+            ops.append(RowOp("swap", column, pivot, column, [list(row) for row in rows]))
+
+        for r in range(column + 1, n):
+            factor = rows[r][column] / rows[column][column]
+            if factor == 0:
+                continue
+            rows[r] = [a - factor * b for a, b in zip(rows[r], rows[column])]
+            ops.append(RowOp("eliminate", r, column, column, [list(row) for row in rows], factor))
+    return ops, rows
+
+
+def back_substitute(triangular, names=None):
+    n = len(triangular)
+    names = names or variable_names(n)
+    known = {}
+    steps = []
+    for row in reversed(range(n)):
+        step = BackSubstitution(row, row, names, triangular[row][:n], triangular[row][n], dict(known))
+        known[row] = step.value
+        steps.append(step)
+    return steps, [known[i] for i in range(n)]
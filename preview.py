@@ -0,0 +1,173 @@
+import argparse
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# Fast preview renders for checking timing and layout.
+# Runs a scene at a fraction of its pixel size and a low frame rate, without
+# the partial movie cache or a movie file. Inside each animation only every
+# --keyframes-th frame runs the animations and updaters and gets rasterized;
+# the frames in between are a pixel cross-fade of the two keyframes around
+# them, not interpolated scene states (a moving dot shows up twice, faded),
+# which is enough to judge timing and layout.
+# Frames are streamed as soon as they exist, to ffplay or a PNG sequence.
+#
+# Everything is configured through tempconfig and patches on the scene
+# instance, so final renders of the same scenes are unaffected.
+#
+#   python preview.py derivative_scanner:DerivativeScannerReels
+#   python preview.py gaussian_reel:GaussianEliminationFinal --from 12 --png-dir /tmp/gauss
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class FFplaySink:
+    def __init__(self, title):
+        self.title = title
+        self.process = None
+
+    def write(self, frame, fps):
+        if self.process is None:
+            height, width = frame.shape[:2]
+            self.process = subprocess.Popen(
+                ["ffplay", "-loglevel", "error", "-window_title", self.title,
+                 "-f", "rawvideo", "-pixel_format", "rgba", "-video_size", f"{width}x{height}",
+                 "-framerate", str(fps), "-i", "-"],
+                stdin=subprocess.PIPE
+            )
+        self.process.stdin.write(frame.tobytes())
+
+    def close(self):
+        if self.process:
+            self.process.stdin.close()
+            self.process.wait()
+
+
+class PNGSink:
+    def __init__(self, directory):
+        self.directory = directory
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(".png"):
+                os.remove(os.path.join(directory, name))
+
+    def write(self, frame, fps):
+        from PIL import Image
+
+        Image.fromarray(frame).save(os.path.join(self.directory, f"{self.count:05d}.png"), compress_level=1)
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+def attach_preview(scene, sink, keyframe_every):
+    # Instance patches: keyframe-only updates, cross-faded in-between frames
+    # and a frame writer that streams to the sink
+    renderer = scene.renderer
+    fps = renderer.camera.frame_rate
+    update_to_time = scene.update_to_time
+    state = {"play": None, "index": None, "frame": None}
+
+    def frame_index(t):
+        return int(round(t * fps))
+
+    def is_keyframe(t):
+        index = frame_index(t)
+        last = int(np.ceil(scene.duration * fps)) - 1
+        return index % keyframe_every == 0 or index >= last
+
+    def keyframe_update_to_time(t):
+        if is_keyframe(t):
+            update_to_time(t)
+
+    def render(scene, t, moving_mobjects):
+        if not is_keyframe(t):
+            return
+        index = frame_index(t)
+        renderer.update_frame(scene, moving_mobjects)
+        frame = renderer.get_frame()
+        if state["play"] == renderer.num_plays and state["index"] is not None:
+            previous, start = state["frame"], state["index"]
+            for i in range(start + 1, index):
+                weight = (i - start) / (index - start)
+                renderer.add_frame(((1 - weight) * previous + weight * frame).astype(np.uint8))
+        # Float copy to blend the next in-between frames from
+        state.update(play=renderer.num_plays, index=index, frame=frame.astype(np.float32))
+        renderer.add_frame(frame)
+
+    def write_frame(frame, num_frames=1, repeat=None):
+        # Frozen frames (waits, static stretches) come once with a count:
+        # num_frames on older manim, repeat on newer
+        for _ in range(repeat if repeat is not None else num_frames):
+            sink.write(frame, fps)
+
+    scene.update_to_time = keyframe_update_to_time
+    renderer.render = render
+    renderer.file_writer.write_frame = write_frame
+
+
+def preview(scene_class, sink, scale=0.25, fps=15, keyframe_every=3, from_animation=None):
+    from manim import config, tempconfig
+
+    width, height = (2 * round(size * scale / 2) for size in (config.pixel_width, config.pixel_height))
+    options = {
+        "pixel_width": width, "pixel_height": height, "frame_rate": fps,
+        "write_to_movie": False, "save_last_frame": False, "disable_caching": True,
+    }
+    if from_animation:
+        options["from_animation_number"] = from_animation
+    start = time.perf_counter()
+    first_frame = []
+
+    def timed(write):
+        def wrapper(frame, fps):
+            if not first_frame:
+                first_frame.append(time.perf_counter() - start)
+            write(frame, fps)
+        return wrapper
+
+    sink.write = timed(sink.write)
+    try:
+        with tempconfig(options):
+            scene = scene_class()
+            attach_preview(scene, sink, keyframe_every)
+            scene.render()
+    finally:
+        sink.close()
+    return first_frame[0] if first_frame else None, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Low resolution, low latency preview of a scene.")
+    parser.add_argument("scene", help="module:Scene")
+    parser.add_argument("--scale", type=float, default=0.25, help="fraction of the scene's pixel size")
+    parser.add_argument("--fps", type=int, default=15)
+    parser.add_argument("--keyframes", type=int, default=3, help="run updaters on every n-th frame, cross-fade the frames in between")
+    parser.add_argument("--from", dest="from_animation", type=int, help="skip the animations before this one")
+    parser.add_argument("--png-dir", help="write a PNG sequence instead of opening ffplay")
+    args = parser.parse_args()
+
+    module_name, scene_name = args.scene.split(":")
+    sys.path.insert(0, PROJECT_DIR)
+    scene_class = getattr(importlib.import_module(module_name), scene_name)
+
+    if args.png_dir or not shutil.which("ffplay"):
+        sink = PNGSink(args.png_dir or os.path.join(PROJECT_DIR, "media", "preview", scene_name))
+    else:
+        sink = FFplaySink(scene_name)
+    first_frame, total = preview(scene_class, sink, args.scale, args.fps, max(1, args.keyframes), args.from_animation)
+    if first_frame is not None:
+        print(f"{scene_name}: first frame after {first_frame:.2f}s, done in {total:.1f}s")
+    if isinstance(sink, PNGSink):
+        print(f"{sink.count} frames in {sink.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,76 +1,74 @@
 from manim import *
-import numpy as np
+from functools import lru_cache
+
+from scan_mobjects import BufferedTracedPath
+from trajectory import simulate_trajectories, trajectory_path
+from tex_cache import cached_mathtex, cached_text
+
+@lru_cache(maxsize=None)
+def projectile_axes():
+    # Shared by every variant rendered in the same process (see sweep_projectiles.py)
+    axes = Axes(
+        x_range=[0, 10, 1],
+        y_range=[0, 6, 1],
+        axis_config={"include_numbers": True},
+        x_length=10,
+        y_length=6
+    ).to_edge(DOWN).shift(UP*0.5)
+
+    labels = axes.get_axis_labels(x_label="Distance (x)", y_label="Height (y)")
+    return axes, labels
+
 
 class ProjectileComparison(Scene):
+    # PHYSICS CONSTANTS
+    # Class attributes so variants can be rendered with projectile_variant()
+    v0 = 8.5              # Initial velocity
+    theta_degrees = 60    # Launch angle
+    g = 9.8               # Gravity
+    k = 0.3               # Drag coefficient for air resistance
+
     def construct(self):
         # 1. SETUP: Introduction Text (Duration: ~4s)
-        title = Text("Projectile Motion", font_size=48).to_edge(UP)
-        subtitle = Text("Vacuum vs. Air Resistance", font_size=36, color=GRAY).next_to(title, DOWN)
+        title = cached_text("Projectile Motion", font_size=48).to_edge(UP)
+        subtitle = cached_text("Vacuum vs. Air Resistance", font_size=36, color=GRAY).next_to(title, DOWN)
         
         self.play(Write(title), run_time=1.5)
         self.play(FadeIn(subtitle), run_time=1.5)
         self.wait(1)
 
         # 2. SETUP: Axes and Ground (Duration: ~3s)
-        axes = Axes(
-            x_range=[0, 10, 1],
-            y_range=[0, 6, 1],
-            axis_config={"include_numbers": True},
-            x_length=10,
-            y_length=6
-        ).to_edge(DOWN).shift(UP*0.5)
-        
-        labels = axes.get_axis_labels(x_label="Distance (x)", y_label="Height (y)")
+        axes, labels = (m.copy() for m in projectile_axes())
 
         self.play(Create(axes), Write(labels), run_time=2)
         self.play(FadeOut(subtitle), run_time=1)
 
         # 3. PHYSICS CONSTANTS
-        v0 = 8.5        # Initial velocity
-        theta = 60 * DEGREES # Launch angle
-        g = 9.8         # Gravity
-        k = 0.3         # Drag coefficient for air resistance
+        v0, g, k = self.v0, self.g, self.k
+        theta = self.theta_degrees * DEGREES
         
         # 4. DEFINE PATHS
-        # Path 1: Ideal (Vacuum) - Simple Parabola
-        # x(t) = v0 * cos(theta) * t
-        # y(t) = v0 * sin(theta) * t - 0.5 * g * t^2
-        def ideal_func(t):
-            x = v0 * np.cos(theta) * t
-            y = v0 * np.sin(theta) * t - 0.5 * g * t**2
-            return axes.c2p(x, y, 0)
-
-        # Path 2: Real (Air Resistance) - Approximation for visual
-        # With drag, velocity decreases exponentially. 
-        def drag_func(t):
-            # Analytic solution for linear drag
-            term = (1 - np.exp(-k * t))
-            x = (v0 * np.cos(theta) / k) * term
-            vt = g / k 
-            y = (v0 * np.sin(theta) + vt) / k * term - vt * t
-            
-            if y < 0: y = 0 
-            return axes.c2p(x, y, 0)
+        # Both launches are integrated together: Ideal (Vacuum, k = 0) and
+        # Real (linear Air Resistance). Each path ends exactly at ground impact.
+        trajectories = simulate_trajectories(v0, theta, g=g, k=[0, k], drag="linear")
 
         # 5. CREATE OBJECTS (Duration: ~2s)
         dot_ideal = Dot(color=BLUE)
         dot_drag = Dot(color=RED)
         
-        label_ideal = Text("Vacuum", color=BLUE, font_size=24).next_to(dot_ideal, UP)
-        label_drag = Text("Air Drag", color=RED, font_size=24).next_to(dot_drag, UP)
+        label_ideal = cached_text("Vacuum", color=BLUE, font_size=24).next_to(dot_ideal, UP)
+        label_drag = cached_text("Air Drag", color=RED, font_size=24).next_to(dot_drag, UP)
 
-        path_ideal = TracedPath(dot_ideal.get_center, stroke_color=BLUE, stroke_width=4)
-        path_drag = TracedPath(dot_drag.get_center, stroke_color=RED, stroke_width=4)
+        path_ideal = BufferedTracedPath(dot_ideal.get_center, stroke_color=BLUE, stroke_width=4)
+        path_drag = BufferedTracedPath(dot_drag.get_center, stroke_color=RED, stroke_width=4)
 
         self.add(path_ideal, path_drag)
         self.play(FadeIn(dot_ideal), FadeIn(dot_drag), run_time=1)
 
         # 6. ANIMATE MOTION (Duration: ~10s)
-        flight_time = 2 * v0 * np.sin(theta) / g
-        
         self.play(
-            MoveAlongPath(dot_ideal, ParametricFunction(ideal_func, t_range=[0, flight_time], fill_opacity=0).set_opacity(0)),
-            MoveAlongPath(dot_drag, ParametricFunction(drag_func, t_range=[0, flight_time], fill_opacity=0).set_opacity(0)),
+            MoveAlongPath(dot_ideal, trajectory_path(axes, trajectories, 0)),
+            MoveAlongPath(dot_drag, trajectory_path(axes, trajectories, 1)),
             run_time=8,
             rate_func=linear
         )
@@ -78,9 +76,9 @@ class ProjectileComparison(Scene):
 
         # 7. RESULTS & FORMULAS (Duration: ~10s)
         range_line = Line(start=dot_drag.get_center(), end=dot_ideal.get_center(), color=YELLOW)
-        range_text = Text("Range Loss", font_size=24, color=YELLOW).next_to(range_line, UP)
+        range_text = cached_text("Range Loss", font_size=24, color=YELLOW).next_to(range_line, UP)
 
-        formula = MathTex(r"\vec{F}_d = -k \vec{v}", color=RED).to_corner(UR).shift(DOWN*1)
+        formula = cached_mathtex(r"\vec{F}_d = -k \vec{v}", color=RED).to_corner(UR).shift(DOWN*1)
 
         self.play(Create(range_line), Write(range_text), run_time=2)
         self.play(Write(formula), run_time=2)
@@ -88,4 +86,15 @@ class ProjectileComparison(Scene):
         self.wait(2)
         
         # Cleanup
-        self.play(FadeOut(Group(axes, labels, dot_ideal, dot_drag, title, range_line, range_text, formula, path_ideal, path_drag)))
\ No newline at end of file
+        self.play(FadeOut(Group(axes, labels, dot_ideal, dot_drag, title, range_line, range_text, formula, path_ideal, path_drag)))
+
+
+def projectile_variant(**params):
+    # ProjectileComparison subclass with some of v0, theta_degrees, g, k replaced
+    unknown = set(params) - {"v0", "theta_degrees", "g", "k"}
+    if unknown:
+        raise ValueError(f"Unknown projectile parameters: {sorted(unknown)}")
+    name = "ProjectileComparison_" + "_".join(
+        f"{key}{value:g}".replace(".", "p").replace("-", "m") for key, value in sorted(params.items())
+    )
+    return type(name, (ProjectileComparison,), params)
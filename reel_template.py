@@ -0,0 +1,101 @@
+from manim import *
+from functools import lru_cache
+
+from tex_cache import cached_text
+
+# Shared template for the 9:16 reels.
+# Importing this module applies the reel frame config. The watermark and
+# outro are built lazily on first use and memoized for every later scene in
+# the same process (batch renders, sweeps, the render server).
+
+# --- CONFIG FOR INSTAGRAM REELS (9:16) ---
+def configure_reel():
+    # A portrait pixel size set by a tool (bench, preview) is kept
+    if abs(config.pixel_width / config.pixel_height - 9 / 16) > 0.01:
+        config.pixel_height = 1920
+        config.pixel_width = 1080
+    config.frame_height = 16.0
+    config.frame_width = 9.0
+
+
+configure_reel()
+# -----------------------------------------
+
+
+@lru_cache(maxsize=None)
+def reel_watermark():
+    watermark = cached_text("think_nebulae", font_size=24, color=GRAY, weight=BOLD)
+    watermark.set_opacity(0.3)
+    watermark.to_edge(DOWN, buff=1.0).to_edge(RIGHT, buff=0.5)
+    return watermark
+
+
+@lru_cache(maxsize=None)
+def reel_outro(gradient):
+    follow_text = cached_text("Follow for more!", font_size=50, weight=BOLD, gradient=gradient)
+    sub_text = cached_text("@think_nebulae", font_size=30, color=GRAY).next_to(follow_text, DOWN)
+    return follow_text, sub_text
+
+
+# Camera backgrounds with the watermark already rasterized into them,
+# by (pixel size, frame size, background color)
+_watermark_layers = {}
+
+
+class ReelScene(Scene):
+    def __init__(self, *args, **kwargs):
+        # Applied again per scene: a quality preset set after this module was
+        # imported (a tool's tempconfig, a reused worker) replaces the frame
+        configure_reel()
+        super().__init__(*args, **kwargs)
+
+    # Static layer: manim rasterizes the mobjects at the front of the scene
+    # that no running animation or updater touches once per animation into
+    # a background frame, and only draws the rest every frame. Anything
+    # added through add_static is kept in that front run.
+
+    def add_static(self, *mobjects):
+        self.add(*mobjects)
+        if not hasattr(self, "static_layer"):
+            self.static_layer = []
+        self.static_layer += [m for m in mobjects if m not in self.static_layer]
+
+        static = [m for m in self.static_layer if m in self.mobjects]
+        self.mobjects = static + [m for m in self.mobjects if m not in static]
+        return self
+
+    def add_layered(self, *mobjects):
+        # Automatic split: groups are unpacked, members without updaters go
+        # to the static layer and the rest are added on top as usual
+        members = []
+        for mob in mobjects:
+            members += mob.submobjects if type(mob) in (VGroup, Group) else [mob]
+        self.add_static(*[m for m in members if not m.get_family_updaters()])
+        self.add(*[m for m in members if m.get_family_updaters()])
+        return self
+
+    def add_watermark(self):
+        watermark = reel_watermark()
+        camera = self.renderer.camera
+        if not hasattr(camera, "background"):
+            # No pixel background to composite into (OpenGL renderer)
+            self.add(watermark.copy())
+            return
+
+        # The camera starts every frame from a copy of its background, so a
+        # watermark baked into it is never rasterized again
+        key = (config.pixel_height, config.pixel_width, config.frame_height, config.frame_width, str(config.background_color))
+        if key not in _watermark_layers:
+            camera.reset()
+            camera.capture_mobjects([watermark])
+            _watermark_layers[key] = camera.pixel_array.copy()
+        camera.background = _watermark_layers[key]
+        camera.reset()
+
+    def outro_animations(self, gradient=(GREEN, BLUE)):
+        follow_text, sub_text = (m.copy() for m in reel_outro(tuple(str(c) for c in gradient)))
+        return [Write(follow_text), FadeIn(sub_text, shift=UP)]
+
+    def play_outro(self, gradient=(GREEN, BLUE), wait_time=3):
+        self.play(*self.outro_animations(gradient), run_time=2)
+        self.wait(wait_time)
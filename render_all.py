@@ -0,0 +1,270 @@
+import argparse
+import ast
+import glob
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from segment_cache import DEFAULT_CACHE_MB, evict_segments, segment_files, touch_used_segments
+
+# Batch renderer for every scene in the project.
+# Scenes are found by parsing the modules (nothing is imported in this
+# process, so each module's config block only affects its own render). Each
+# render runs as its own `manim render` process. A scene can also be split
+# into shards by animation number and the partial movies concatenated
+# afterwards. Unchanged play/wait segments come from manim's partial movie
+# cache (see segment_cache.py), so re-renders after small edits are quick.
+#
+#   python render_all.py -q h --memory-mb 8000
+#   python render_all.py -q h --shards 4 derivative_scanner:DerivativeScannerReels
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Helper modules that never define reels
+TOOL_MODULES = {
+    "bench_scenes", "preview", "render_all", "render_options", "render_profiler", "render_server",
+    "segment_cache", "sweep_projectiles", "timeline",
+}
+BASE_SCENES = {"Scene", "MovingCameraScene", "ZoomedScene", "ThreeDScene", "VectorScene", "LinearTransformationScene"}
+
+
+# --- Discovery ---
+
+def discover_scenes(project_dir=PROJECT_DIR):
+    classes = {}
+    for path in sorted(glob.glob(os.path.join(project_dir, "*.py"))):
+        module = os.path.splitext(os.path.basename(path))[0]
+        if module in TOOL_MODULES:
+            continue
+        with open(path) as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                bases = [b.id if isinstance(b, ast.Name) else getattr(b, "attr", None) for b in node.bases]
+                defines_construct = any(
+                    isinstance(item, ast.FunctionDef) and item.name == "construct" for item in node.body
+                )
+                classes[node.name] = (module, bases, defines_construct)
+
+    # Scene subclasses, following bases defined in other project modules
+    scenes = set(BASE_SCENES)
+    changed = True
+    while changed:
+        changed = False
+        for name, (_, bases, _) in classes.items():
+            if name not in scenes and any(base in scenes for base in bases):
+                scenes.add(name)
+                changed = True
+
+    def has_construct(name):
+        if name not in classes:
+            return False
+        _, bases, defines_construct = classes[name]
+        return defines_construct or any(has_construct(base) for base in bases)
+
+    # Base classes other scenes build on (like a reel template) aren't reels
+    used_as_base = {base for _, bases, _ in classes.values() for base in bases}
+    return [
+        (module, name) for name, (module, _, _) in classes.items()
+        if name in scenes and name not in BASE_SCENES and name not in used_as_base
+        and not name.startswith("_") and has_construct(name)
+    ]
+
+
+def count_animations(module_name, scene_name):
+    # Runs in a child process: play the scene without rendering any frames
+    sys.path.insert(0, PROJECT_DIR)
+    from manim import tempconfig
+
+    module = importlib.import_module(module_name)
+    with tempconfig({"dry_run": True}):
+        scene = getattr(module, scene_name)()
+        scene.renderer._original_skipping_status = True
+        scene.renderer.skip_animations = True
+        scene.render()
+    return scene.renderer.num_plays
+
+
+# --- Memory accounting ---
+
+def tree_rss_mb(pid):
+    # Resident memory of a process and its children (manim spawns ffmpeg)
+    total = 0
+    pids = [pid]
+    while pids:
+        current = pids.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+            with open(f"/proc/{current}/task/{current}/children") as f:
+                pids.extend(int(child) for child in f.read().split())
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+    return total / 1024
+
+
+# --- Jobs ---
+
+class RenderJob:
+    def __init__(self, module, scene, quality, shard=None, media_dir=None):
+        self.module = module
+        self.scene = scene
+        self.quality = quality
+        # (index, first animation, last animation) or None for a full render
+        self.shard = shard
+        self.media_dir = media_dir
+        self.peak_mb = 0
+        self.start = self.end = None
+        self.returncode = None
+
+    @property
+    def output_name(self):
+        return f"{self.scene}_part{self.shard[0]:03d}" if self.shard else self.scene
+
+    def command(self):
+        cmd = [
+            sys.executable, "-m", "manim", "render", f"-q{self.quality}",
+            os.path.join(PROJECT_DIR, f"{self.module}.py"), self.scene,
+        ]
+        if self.shard:
+            _, first, last = self.shard
+            cmd += ["-n", f"{first},{last}", "-o", self.output_name]
+        if self.media_dir:
+            cmd += ["--media_dir", self.media_dir]
+        return cmd
+
+    def movie(self):
+        found = glob.glob(os.path.join(self.media_dir, "videos", "**", f"{self.output_name}.mp4"), recursive=True)
+        return found[0] if found else None
+
+
+def shard_ranges(num_animations, shards):
+    # manim treats animation number 0 as "unset", so the first shard must
+    # end at 1 or later: keep at least two animations per shard
+    shards = max(1, min(shards, num_animations // 2))
+    bounds = [round(i * num_animations / shards) for i in range(shards + 1)]
+    return [(i, bounds[i], bounds[i + 1] - 1) for i in range(shards)]
+
+
+def run_jobs(jobs, workers, memory_mb, estimate_mb, log=print):
+    # Start jobs while there is a free worker and the measured memory of the
+    # running renders plus the largest peak seen so far fits the budget
+    pending = list(jobs)
+    running = {}
+    while pending or running:
+        for job, proc in list(running.items()):
+            job.peak_mb = max(job.peak_mb, tree_rss_mb(proc.pid))
+            if proc.poll() is not None:
+                job.end = time.perf_counter()
+                job.returncode = proc.returncode
+                estimate_mb = max(estimate_mb, job.peak_mb)
+                del running[job]
+                status = "ok" if job.returncode == 0 else f"failed ({job.returncode})"
+                log(f"{job.output_name}: {status} in {job.end - job.start:.1f}s, peak {job.peak_mb:.0f} MB")
+
+        used_mb = sum(max(job.peak_mb, estimate_mb) for job in running)
+        while pending and len(running) < workers and (not running or used_mb + estimate_mb <= memory_mb):
+            job = pending.pop(0)
+            job.start = time.perf_counter()
+            running[job] = subprocess.Popen(job.command(), cwd=PROJECT_DIR, stdout=subprocess.DEVNULL)
+            used_mb += estimate_mb
+        time.sleep(0.2)
+
+
+def concat_movies(movies, output):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        listing.writelines(f"file '{os.path.abspath(movie)}'\n" for movie in movies)
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", listing.name, "-c", "copy", output],
+            check=True
+        )
+    finally:
+        os.remove(listing.name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every scene in the project in parallel.")
+    parser.add_argument("scenes", nargs="*", help="module:Scene pairs (default: all discovered scenes)")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--memory-mb", type=float, default=8000, help="total memory budget for running renders")
+    parser.add_argument("--estimate-mb", type=float, default=1000, help="assumed peak of a render before one finishes")
+    parser.add_argument("--shards", type=int, default=1, help="split each scene's animations across this many workers")
+    parser.add_argument("--media-dir", default=os.path.join(PROJECT_DIR, "media"))
+    parser.add_argument("--cache-mb", type=float, default=DEFAULT_CACHE_MB, help="size limit of the segment cache")
+    parser.add_argument("--report", help="write per-scene timings as JSON")
+    parser.add_argument("--count", nargs=2, metavar=("MODULE", "SCENE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.count:
+        print(count_animations(*args.count))
+        return
+
+    scenes = [tuple(s.split(":")) for s in args.scenes] or discover_scenes()
+    jobs = {}
+    for module, scene in scenes:
+        if args.shards > 1:
+            counted = subprocess.run(
+                [sys.executable, __file__, "--count", module, scene],
+                cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+            )
+            num_animations = int(counted.stdout.split()[-1])
+            jobs[module, scene] = [
+                # One media dir per shard: manim keeps a single partial movie
+                # list per scene directory, parallel shards would overwrite
+                # each other's. Shards cover disjoint animations and never
+                # share segments; a shard re-rendered with the same split
+                # finds its own again.
+                RenderJob(module, scene, args.quality, shard,
+                          os.path.join(args.media_dir, "shards", scene, f"part{shard[0]:03d}"))
+                for shard in shard_ranges(num_animations, args.shards)
+            ]
+        else:
+            jobs[module, scene] = [RenderJob(module, scene, args.quality, media_dir=args.media_dir)]
+
+    cached_before = segment_files(args.media_dir)
+    run_jobs([job for scene_jobs in jobs.values() for job in scene_jobs], args.workers, args.memory_mb, args.estimate_mb)
+    rendered = segment_files(args.media_dir) - cached_before
+
+    report = {}
+    for (module, scene), scene_jobs in jobs.items():
+        ok = all(job.returncode == 0 for job in scene_jobs)
+        end = max(job.end for job in scene_jobs)
+        media_dirs = {job.media_dir for job in scene_jobs}
+        if ok and scene_jobs[0].shard:
+            output = os.path.join(args.media_dir, "videos", module, f"{scene}.mp4")
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+            concat_movies([job.movie() for job in scene_jobs], output)
+            end = time.perf_counter()
+        report[scene] = {
+            "module": module,
+            "ok": ok,
+            "wall_time": end - min(job.start for job in scene_jobs),
+            "peak_mb": max(job.peak_mb for job in scene_jobs),
+            "shards": len(scene_jobs),
+            "segments_used": sum(touch_used_segments(media_dir, scene) for media_dir in media_dirs),
+            "segments_rendered": len(rendered & set().union(*(segment_files(d, scene) for d in media_dirs))),
+        }
+
+    evict_segments(args.media_dir, args.cache_mb)
+
+    for scene, row in report.items():
+        print(
+            f"{scene:32s} {'ok' if row['ok'] else 'FAILED':7s} {row['wall_time']:8.1f}s {row['peak_mb']:8.0f} MB"
+            f"  {row['segments_rendered']} of {row['segments_used']} segments rendered"
+        )
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(0 if all(row["ok"] for row in report.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# Command line values shared by the render tools (sweep, bench, profiler,
+# timeline, render server).
+
+QUALITIES = {
+    "l": "low_quality", "m": "medium_quality", "h": "high_quality",
+    "p": "production_quality", "k": "fourk_quality",
+}
+
+
+def parse_values(text):
+    # "0.1,0.3,0.5" or an inclusive range "start:stop:step"
+    if ":" in text:
+        start, stop, step = (float(part) for part in text.split(":"))
+        count = int(round((stop - start) / step)) + 1
+        return [start + i * step for i in range(count)]
+    return [float(part) for part in text.split(",")]
@@ -0,0 +1,315 @@
+import argparse
+import importlib
+import inspect
+import json
+import os
+import resource
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from render_options import QUALITIES
+
+# Opt-in profiler for scene renders.
+# While active it patches a handful of manim entry points (and restores them
+# afterwards) to time, per play/wait call: LaTeX and Text compilation, tex
+# cache loads, animation interpolation, every updater separately,
+# rasterization and writing frames to the encoder. Untimed time since the
+# previous play is "between_plays": construct code between the calls, and
+# scene setup before the first one. Building mobjects isn't a phase of its
+# own, what happens inside play() and updaters is charged to those phases.
+# Times are self times, so the phases of a play add up to its wall time.
+# The report is JSON; the folded file feeds flamegraph.pl / speedscope.
+#
+#   python render_profiler.py derivative_scanner:DerivativeScannerReels -q l
+#   python render_profiler.py gaussian_reel:GaussianEliminationFinal --folded gauss.folded
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+PHASES = ["between_plays", "latex", "text", "tex_cache", "animation", "updaters", "rasterize", "encode", "finish", "other"]
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _from_manim(code):
+    return f"{os.sep}manim{os.sep}" in code.co_filename
+
+
+def describe(func):
+    code = getattr(func, "__code__", None)
+    name = getattr(func, "__qualname__", type(func).__name__)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})" if code else name
+
+
+def updater_label(mob, func):
+    # Updaters made by manim helpers (always_redraw, f_always, ...) are
+    # closures over the scene's own function: name them after that one
+    code = getattr(func, "__code__", None)
+    if code and _from_manim(code):
+        for cell in func.__closure__ or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                continue
+            if inspect.isfunction(value) and not _from_manim(value.__code__):
+                helper = func.__qualname__.split(".<locals>")[0]
+                return f"{type(mob).__name__} {helper} {describe(value)}"
+    return f"{type(mob).__name__} {describe(func)}"
+
+
+class _TimedUpdater:
+    # Stands in for an updater in mob.updaters. Compares equal to the wrapped
+    # function so remove_updater keeps working, and exposes it as __wrapped__
+    # so manim's signature check still sees the dt parameter.
+    def __init__(self, profile, mob, function):
+        self.profile = profile
+        self.function = self.__wrapped__ = function
+        self.label = updater_label(mob, function)
+
+    def __call__(self, *args, **kwargs):
+        with self.profile.span("updaters", self.label):
+            return self.function(*args, **kwargs)
+
+    def __eq__(self, other):
+        return other is self or other is self.function
+
+    def __hash__(self):
+        return hash(self.function)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class RenderProfile:
+    def __init__(self):
+        # Open spans: [phase, label, time spent in nested spans]
+        self.stack = []
+        self.plays = []
+        # Phases timed outside any play, charged to the next one
+        self.pending = defaultdict(float)
+        self.pending_updaters = defaultdict(float)
+        self.current = None
+        self.last_end = self.start = time.perf_counter()
+
+    @contextmanager
+    def span(self, phase, label=None):
+        start = time.perf_counter()
+        self.stack.append([phase, label, 0.0])
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _, _, nested = self.stack.pop()
+            if self.stack:
+                self.stack[-1][2] += elapsed
+            phases = self.current["phases"] if self.current else self.pending
+            phases[phase] += elapsed - nested
+            if label:
+                updaters = self.current["updaters"] if self.current else self.pending_updaters
+                updaters[label] += elapsed - nested
+
+    def _open(self, animations):
+        now = time.perf_counter()
+        phases = defaultdict(float, self.pending)
+        # Whatever ran since the last play and wasn't timed
+        phases["between_plays"] += max(0.0, now - self.last_end - sum(self.pending.values()))
+        self.current = {
+            "index": len(self.plays),
+            "animations": animations,
+            "frames": 0,
+            "phases": phases,
+            "updaters": defaultdict(float, self.pending_updaters),
+            "start": now,
+        }
+        self.pending.clear()
+        self.pending_updaters.clear()
+
+    def _close(self):
+        record = self.current
+        self.current = None
+        self.last_end = time.perf_counter()
+        record["wall_time"] = self.last_end - record.pop("start")
+        record["phases"]["other"] += max(0.0, record["wall_time"] - sum(record["phases"].values()))
+        record["peak_rss_mb"] = _peak_rss_mb()
+        self.plays.append(record)
+
+    @contextmanager
+    def play(self, animations):
+        self._open(animations)
+        try:
+            yield
+        finally:
+            self._close()
+
+    def finish(self):
+        # Code after the last play and the final movie combine
+        if self.pending or time.perf_counter() - self.last_end > 1e-3:
+            self._open(["<after last play>"])
+            self._close()
+        self.end = time.perf_counter()
+
+    # --- Output ---
+
+    def report(self, scene=None):
+        totals, updaters = defaultdict(float), defaultdict(float)
+        for record in self.plays:
+            for phase, seconds in record["phases"].items():
+                totals[phase] += seconds
+            for label, seconds in record["updaters"].items():
+                updaters[label] += seconds
+        return {
+            "scene": scene,
+            "wall_time": self.end - self.start,
+            "frames": sum(record["frames"] for record in self.plays),
+            "peak_rss_mb": _peak_rss_mb(),
+            "phases": {phase: totals[phase] for phase in PHASES if phase in totals},
+            "updaters": dict(sorted(updaters.items(), key=lambda item: -item[1])),
+            "plays": [
+                {**record, "phases": dict(record["phases"]), "updaters": dict(record["updaters"])}
+                for record in self.plays
+            ],
+        }
+
+    def folded(self, scene="render"):
+        # One "frame;frame;... microseconds" line per leaf
+        def clean(name):
+            return name.replace(";", ",")
+
+        lines = []
+        for record in self.plays:
+            prefix = f"{clean(scene)};play {record['index']:03d} {clean(', '.join(record['animations']))}"
+            for phase, seconds in record["phases"].items():
+                if phase != "updaters" and seconds > 0:
+                    lines.append(f"{prefix};{phase} {round(seconds * 1e6)}")
+            for label, seconds in record["updaters"].items():
+                lines.append(f"{prefix};updaters;{clean(label)} {round(seconds * 1e6)}")
+        return "\n".join(line for line in lines if not line.endswith(" 0")) + "\n"
+
+
+def _animation_names(scene, args):
+    names = []
+    for animation in getattr(scene, "animations", None) or args:
+        mob = getattr(animation, "mobject", None)
+        names.append(f"{type(animation).__name__}({type(mob).__name__})" if mob is not None else type(animation).__name__)
+    return names
+
+
+@contextmanager
+def profile_render():
+    from manim import Mobject, Scene, Text
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+    import manim.mobject.text.tex_mobject as tex_mobject
+    import manim.utils.tex_file_writing as tex_file_writing
+    import tex_cache
+
+    profile = RenderProfile()
+
+    def timed(phase, original):
+        def wrapper(*args, **kwargs):
+            with profile.span(phase):
+                return original(*args, **kwargs)
+        return wrapper
+
+    def play(scene, *args, **kwargs):
+        with profile.play([]):
+            try:
+                return originals[Scene, "play"](scene, *args, **kwargs)
+            finally:
+                profile.current["animations"] = _animation_names(scene, args)
+
+    def write_frame(writer, *args, **kwargs):
+        if profile.current:
+            profile.current["frames"] += 1
+        with profile.span("encode"):
+            return originals[SceneFileWriter, "write_frame"](writer, *args, **kwargs)
+
+    def add_updater(mob, update_function, *args, **kwargs):
+        if not isinstance(update_function, _TimedUpdater):
+            update_function = _TimedUpdater(profile, mob, update_function)
+        return originals[Mobject, "add_updater"](mob, update_function, *args, **kwargs)
+
+    patches = {
+        (Scene, "play"): play,
+        (Scene, "update_to_time"): None,
+        (CairoRenderer, "update_frame"): None,
+        (SceneFileWriter, "write_frame"): write_frame,
+        (SceneFileWriter, "finish"): None,
+        (Mobject, "add_updater"): add_updater,
+        (tex_file_writing, "tex_to_svg_file"): None,
+        (tex_mobject, "tex_to_svg_file"): None,
+        (Text, "_text2svg"): None,
+        (tex_cache.TexCache, "get"): None,
+    }
+    phases = {
+        "update_to_time": "animation", "update_frame": "rasterize", "finish": "finish",
+        "tex_to_svg_file": "latex", "_text2svg": "text", "get": "tex_cache",
+    }
+    originals = {
+        (owner, name): getattr(owner, name) for owner, name in patches
+        if hasattr(owner, name)
+    }
+    # Restore what each owner defined itself, so nothing shadows a base class
+    saved = {key: vars(key[0]).get(key[1]) for key in originals}
+    try:
+        for (owner, name), original in originals.items():
+            setattr(owner, name, patches[owner, name] or timed(phases[name], original))
+        yield profile
+    finally:
+        for (owner, name), value in saved.items():
+            if value is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, value)
+        profile.finish()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the render of one scene.")
+    parser.add_argument("scene", help="module:Scene")
+    parser.add_argument("-q", "--quality", default="l", choices=QUALITIES)
+    parser.add_argument("--report", help="JSON report (default: media/profiles/<Scene>.json)")
+    parser.add_argument("--folded", help="folded stacks for flamegraph.pl (default: media/profiles/<Scene>.folded)")
+    parser.add_argument("--use-cache", action="store_true", help="keep manim's partial movie cache (cached plays render nothing)")
+    parser.add_argument("--media-dir", default=os.path.join(PROJECT_DIR, "media"))
+    parser.add_argument("--top", type=int, default=10, help="updaters listed in the summary")
+    args = parser.parse_args()
+
+    module_name, scene_name = args.scene.split(":")
+    sys.path.insert(0, PROJECT_DIR)
+    from manim import tempconfig
+
+    module = importlib.import_module(module_name)
+    scene_class = getattr(module, scene_name)
+    profile_dir = os.path.join(args.media_dir, "profiles")
+    os.makedirs(profile_dir, exist_ok=True)
+    report_path = args.report or os.path.join(profile_dir, f"{scene_name}.json")
+    folded_path = args.folded or os.path.join(profile_dir, f"{scene_name}.folded")
+
+    with tempconfig({
+        "quality": QUALITIES[args.quality], "media_dir": args.media_dir, "disable_caching": not args.use_cache,
+    }):
+        with profile_render() as profile:
+            scene_class().render()
+
+    report = profile.report(args.scene)
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+    with open(folded_path, "w") as f:
+        f.write(profile.folded(scene_name))
+
+    print(f"{scene_name}: {report['wall_time']:.2f}s, {report['frames']} frames, peak {report['peak_rss_mb']:.0f} MB")
+    for phase, seconds in report["phases"].items():
+        print(f"  {phase:12s} {seconds:8.3f}s")
+    for label, seconds in list(report["updaters"].items())[:args.top]:
+        print(f"  {seconds:8.3f}s  {label}")
+    print(f"Report: {report_path}\nFolded stacks: {folded_path}")
+
+
+if __name__ == "__main__":
+    main()
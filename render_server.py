@@ -0,0 +1,270 @@
+import argparse
+import importlib
+import json
+import os
+import select
+import socket
+import sys
+import tempfile
+import time
+
+from render_options import QUALITIES
+
+# Warm render server.
+# Every `manim render` starts from scratch: importing manim (cairo, pango,
+# numpy, scipy), loading fonts and the TeX and text caches takes seconds
+# before the first frame. The server pays that once: it imports manim and the
+# shared helper modules, builds the memoized reel watermark and outro, and
+# then waits for jobs on a local socket. Each job runs in a forked child, so
+# it starts with all of that already in memory and its config changes and
+# mobjects never leak into the next job. Scene modules aren't preloaded, each
+# job imports its scene in the child; helper modules edited since the server
+# started are dropped and imported fresh there, so a running server doesn't
+# need restarting after edits.
+#
+#   python render_server.py serve -j 2 &
+#   python render_server.py submit derivative_scanner:DerivativeScannerReels -q h
+#   python render_server.py status
+#   python render_server.py stop
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.environ.get(
+    "REEL_RENDER_SOCKET", os.path.join(tempfile.gettempdir(), f"think_nebulae_render_{os.getuid()}.sock")
+)
+# Seconds a client gets to send its request before it's dropped
+REQUEST_TIMEOUT = 2.0
+# Shared by the scenes, imported once by the server
+PRELOAD_MODULES = [
+    "tex_cache", "function_registry", "reel_template", "scan_engine", "scan_mobjects",
+    "curve_sampler", "augmented_matrix", "gaussian_solver", "trajectory", "scanner_reel",
+]
+
+
+# --- Messages: one JSON object per line ---
+
+def send(conn, message):
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def receive(conn):
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data) if data.strip() else None
+
+
+# --- Server ---
+
+def project_modules():
+    # Project modules in sys.modules, with the mtime of their file
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        if name == "__main__":
+            continue
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == PROJECT_DIR:
+            modules[name] = os.path.getmtime(path) if os.path.exists(path) else None
+    return modules
+
+
+def preload(modules=PRELOAD_MODULES):
+    sys.path.insert(0, PROJECT_DIR)
+    start = time.perf_counter()
+    from manim import tempconfig
+
+    # The reel config the helpers apply on import is undone afterwards, jobs
+    # start from manim's defaults like a fresh process (run_job applies it
+    # again for reel scenes)
+    with tempconfig({}):
+        for name in modules:
+            importlib.import_module(name)
+        reel_template = sys.modules["reel_template"]
+        reel_template.reel_watermark()
+        reel_template.reel_outro(tuple(str(c) for c in (reel_template.GREEN, reel_template.BLUE)))
+    return project_modules(), time.perf_counter() - start
+
+
+def drop_stale_modules(loaded):
+    # One edited helper can leave stale references in the others: if any
+    # changed, every project module is imported fresh
+    current = project_modules()
+    if any(current.get(name) != mtime for name, mtime in loaded.items()):
+        for name in current:
+            del sys.modules[name]
+        return True
+    return False
+
+
+def run_job(conn, request, loaded):
+    # Runs in the forked child
+    start = time.perf_counter()
+    result = {"ok": False}
+    try:
+        media_dir = request.get("media_dir") or os.path.join(PROJECT_DIR, "media")
+        log_path = os.path.join(media_dir, "logs", f"{request['scene']}.log")
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        result["log"] = log_path
+        log = open(log_path, "w")
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+
+        result["reloaded"] = drop_stale_modules(loaded)
+        from manim import config, tempconfig
+
+        options = {"quality": QUALITIES[request.get("quality", "h")], "media_dir": media_dir}
+        options.update(request.get("config", {}))
+        with tempconfig(options):
+            # Imported after the quality preset, so the module's own config
+            # block wins as with `manim render`. The preloaded reel_template
+            # isn't imported again, its reel config is replayed here
+            scene_class = getattr(importlib.import_module(request["module"]), request["scene"])
+            reel_template = sys.modules.get("reel_template")
+            if reel_template and issubclass(scene_class, reel_template.ReelScene):
+                reel_template.configure_reel()
+            scene = scene_class()
+            writer = scene.renderer.file_writer
+            write_frame = writer.write_frame
+
+            def timed_write_frame(*args, **kwargs):
+                result.setdefault("first_frame", time.perf_counter() - start)
+                return write_frame(*args, **kwargs)
+
+            writer.write_frame = timed_write_frame
+            scene.render()
+            result["movie"] = str(writer.movie_file_path) if config.write_to_movie else None
+        # os._exit below skips the tex cache's eviction at exit
+        if "tex_cache" in sys.modules and sys.modules["tex_cache"].tex_cache.written:
+            sys.modules["tex_cache"].tex_cache.evict()
+        result["ok"] = True
+    except BaseException as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["seconds"] = time.perf_counter() - start
+    try:
+        send(conn, result)
+    finally:
+        os._exit(0 if result["ok"] else 1)
+
+
+def serve(path=SOCKET_PATH, jobs=2, log=print):
+    loaded, seconds = preload()
+    log(f"preloaded {len(loaded)} modules in {seconds:.1f}s, listening on {path}")
+
+    if os.path.exists(path):
+        os.remove(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    pending = []
+    running = {}
+    try:
+        while True:
+            # Reap finished jobs, start queued ones
+            for pid in list(running):
+                done, status = os.waitpid(pid, os.WNOHANG)
+                if done:
+                    conn, request = running.pop(pid)
+                    conn.close()
+                    log(f"{request['module']}:{request['scene']} exited with {os.waitstatus_to_exitcode(status)}")
+            while pending and len(running) < jobs:
+                conn, request = pending.pop(0)
+                pid = os.fork()
+                if pid == 0:
+                    server.close()
+                    run_job(conn, request, loaded)
+                running[pid] = (conn, request)
+
+            if not select.select([server], [], [], 0.2)[0]:
+                continue
+            conn, _ = server.accept()
+            # The loop is single-threaded: a client that never finishes its
+            # request must not stall reaping and starting jobs
+            conn.settimeout(REQUEST_TIMEOUT)
+            try:
+                request = receive(conn) or {}
+            except (OSError, ValueError):
+                conn.close()
+                continue
+            conn.settimeout(None)
+            command = request.get("command")
+            if command == "render":
+                pending.append((conn, request))
+                continue
+            if command == "status":
+                send(conn, {
+                    "running": [f"{r['module']}:{r['scene']}" for _, r in running.values()],
+                    "pending": [f"{r['module']}:{r['scene']}" for _, r in pending],
+                    "jobs": jobs,
+                })
+            elif command == "stop":
+                send(conn, {"ok": True})
+                conn.close()
+                break
+            else:
+                send(conn, {"ok": False, "error": f"unknown command {command!r}"})
+            conn.close()
+    finally:
+        server.close()
+        os.remove(path)
+        for pid in running:
+            os.waitpid(pid, 0)
+
+
+# --- Client ---
+
+def request(message, path=SOCKET_PATH):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            conn.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            sys.exit(f"no render server on {path} (start one with: python render_server.py serve)")
+        send(conn, message)
+        return receive(conn)
+
+
+def parse_setting(text):
+    key, value = text.split("=", 1)
+    try:
+        value = json.loads(value)
+    except json.JSONDecodeError:
+        pass
+    return key, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render scenes in a warm, preloaded server process.")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="preload manim and wait for jobs")
+    serve_parser.add_argument("-j", "--jobs", type=int, default=2, help="renders running at once")
+    submit = commands.add_parser("submit", help="render a scene and wait for it")
+    submit.add_argument("scene", help="module:Scene")
+    submit.add_argument("-q", "--quality", default="h", choices=QUALITIES)
+    submit.add_argument("--media-dir", default=os.path.join(PROJECT_DIR, "media"))
+    submit.add_argument("--set", dest="settings", action="append", default=[], type=parse_setting,
+                        metavar="KEY=VALUE", help="extra manim config, e.g. --set from_animation_number=3")
+    commands.add_parser("status")
+    commands.add_parser("stop")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket, args.jobs)
+    elif args.command == "submit":
+        module_name, scene_name = args.scene.split(":")
+        result = request({
+            "command": "render", "module": module_name, "scene": scene_name, "quality": args.quality,
+            "media_dir": os.path.abspath(args.media_dir), "config": dict(args.settings),
+        }, args.socket)
+        if result is None or not result["ok"]:
+            sys.exit(f"{scene_name}: {result['error'] if result else 'server closed the connection'}"
+                     + (f" (log: {result['log']})" if result and "log" in result else ""))
+        first_frame = f", first frame after {result['first_frame']:.2f}s" if "first_frame" in result else ""
+        print(f"{scene_name}: done in {result['seconds']:.1f}s{first_frame} -> {result['movie']}")
+    else:
+        print(json.dumps(request({"command": args.command}, args.socket), indent=2))
+
+
+if __name__ == "__main__":
+    main()
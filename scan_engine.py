@@ -0,0 +1,165 @@
+from manim import *
+import numpy as np
+
+# Shared engine for the scanner reels.
+# A scan moves one ValueTracker linearly across a known range, so the x value
+# of every frame is known before rendering starts. The engine evaluates the
+# scene functions and axis mappings for all of those x values in one NumPy
+# batch, and the per-frame updaters only look values up and move existing
+# mobjects.
+
+
+def axes_units(axes):
+    # Origin and unit vectors of a linear Axes in scene coordinates
+    origin = np.array(axes.c2p(0, 0))
+    x_unit = np.array(axes.c2p(1, 0)) - origin
+    y_unit = np.array(axes.c2p(0, 1)) - origin
+    return origin, x_unit, y_unit
+
+
+def axes_to_scene(axes):
+    # Vectorized ax.c2p: linear axes are an affine map, so whole arrays of
+    # coordinates can be mapped at once instead of one c2p call per point
+    origin, x_unit, y_unit = axes_units(axes)
+
+    def c2p(xs, ys):
+        xs = np.asarray(xs, dtype=float)[..., None]
+        ys = np.asarray(ys, dtype=float)[..., None]
+        return origin + xs * x_unit + ys * y_unit
+
+    return c2p
+
+
+def evaluate(func, xs):
+    # Scene functions are written with NumPy ufuncs, but plain-Python ones
+    # (branches, math.*) still work through np.vectorize
+    xs = np.asarray(xs, dtype=float)
+    try:
+        ys = np.asarray(func(xs), dtype=float)
+    except (TypeError, ValueError):
+        ys = np.vectorize(func, otypes=[float])(xs)
+    return np.broadcast_to(ys, xs.shape).copy()
+
+
+class ScanDashedLine(VMobject):
+    # DashedLine that can be moved every frame without rebuilding mobjects.
+    # All dashes live as separate subpaths of a single VMobject.
+    def __init__(self, dash_length=DEFAULT_DASH_LENGTH, dashed_ratio=0.5, **kwargs):
+        super().__init__(**kwargs)
+        self.dash_length = dash_length
+        self.dashed_ratio = dashed_ratio
+
+    def put_start_and_end_on(self, start, end):
+        start = np.asarray(start, dtype=float)
+        vect = np.asarray(end, dtype=float) - start
+        length = np.linalg.norm(vect)
+
+        # Same dash layout as DashedLine / DashedVMobject for an open path
+        num_dashes = max(2, int(np.ceil(length / self.dash_length * self.dashed_ratio)))
+        dash_len = self.dashed_ratio / num_dashes
+        starts = np.linspace(0, 1 - dash_len, num_dashes)
+
+        # One straight cubic bezier (4 control points) per dash
+        handles = np.array([0, 1 / 3, 2 / 3, 1]) * dash_len
+        alphas = (starts[:, None] + handles[None, :]).reshape(-1)
+        self.set_points(start + alphas[:, None] * vect)
+        return self
+
+
+class ScanTrace(VMobject):
+    # Path drawn by a scan, derived from the scan position instead of
+    # accumulated frame by frame, so any frame can be drawn directly.
+    # The beziers of the whole path are built once and sliced per frame.
+    def __init__(self, points, **kwargs):
+        super().__init__(**kwargs)
+        self.corners = np.asarray(points, dtype=float)
+        handles = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+        vects = (self.corners[1:] - self.corners[:-1])[:, None, :]
+        self.beziers = (self.corners[:-1, None, :] + handles * vects).reshape(-1, 3)
+
+    def set_progress(self, i):
+        # i is a (fractional) index into points
+        lo = int(i)
+        if lo >= len(self.corners) - 1:
+            self.points = self.beziers.copy()
+            return self
+        end = self.corners[lo] + (self.corners[lo + 1] - self.corners[lo]) * (i - lo)
+        partial = self.corners[lo] + np.array([0, 1 / 3, 2 / 3, 1])[:, None] * (end - self.corners[lo])
+        self.points = np.vstack([self.beziers[:4 * lo], partial])
+        return self
+
+
+class ScanEngine:
+    def __init__(self, tracker, start, end, run_time, frame_rate=None):
+        frame_rate = frame_rate or config.frame_rate
+        num_frames = int(np.ceil(run_time * frame_rate)) + 1
+
+        self.tracker = tracker
+        self.start = start
+        # x value of every frame for a linear scan from start to end
+        self.xs = np.linspace(start, end, num_frames)
+        self.step = (end - start) / (num_frames - 1)
+
+    # --- Batch evaluation (runs once, before rendering) ---
+
+    def values(self, func):
+        return evaluate(func, self.xs)
+
+    def points(self, axes, func):
+        return axes_to_scene(axes)(self.xs, self.values(func))
+
+    def baseline(self, axes, y=0):
+        return axes_to_scene(axes)(self.xs, np.full_like(self.xs, y))
+
+    # --- Per-frame lookup ---
+
+    def index(self):
+        # Position of the tracker in the precomputed frame grid. Exact on frame
+        # times for a linear scan, fractional if the tracker lands between.
+        if self.step == 0:
+            return 0.0
+        i = (self.tracker.get_value() - self.start) / self.step
+        return min(max(i, 0.0), len(self.xs) - 1.0)
+
+    def lookup(self, table):
+        i = min(self.index(), len(table) - 1.0)
+        lo = int(i)
+        hi = min(lo + 1, len(table) - 1)
+        return table[lo] + (table[hi] - table[lo]) * (i - lo)
+
+    # --- Updaters that only move existing mobjects ---
+
+    def follow(self, mob, points):
+        mob.add_updater(lambda m: m.move_to(self.lookup(points)), call_updater=True)
+        return mob
+
+    def segment(self, line, starts, ends):
+        # Points are set directly so a zero-length frame (e.g. sin(x) = 0 under
+        # the scan line) can't collapse the line the way rotate/scale would
+        line.add_updater(
+            lambda m: m.set_points_as_corners([self.lookup(starts), self.lookup(ends)]),
+            call_updater=True
+        )
+        return line
+
+    def tangent(self, tangent):
+        # AnalyticTangent endpoints for every frame, batched like the points
+        return self.segment(tangent, *tangent.endpoints(self.xs))
+
+    def dashed(self, starts, ends, **kwargs):
+        line = ScanDashedLine(**kwargs)
+        line.add_updater(
+            lambda m: m.put_start_and_end_on(self.lookup(starts), self.lookup(ends)),
+            call_updater=True
+        )
+        return line
+
+    def trace(self, points, **kwargs):
+        # Seekable stand-in for a traced path of a follow()ed mobject
+        path = ScanTrace(points, **kwargs)
+        path.add_updater(lambda m: m.set_progress(self.index()), call_updater=True)
+        return path
+
+    def number(self, decimal, values):
+        decimal.add_updater(lambda m: m.set_value(self.lookup(values)), call_updater=True)
+        return decimal
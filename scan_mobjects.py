@@ -0,0 +1,284 @@
+from manim import *
+import numpy as np
+
+from scan_engine import axes_to_scene, axes_units, evaluate
+from tex_cache import cached_mathtex
+
+# Mobjects for the scanner reels that are updated in place every frame
+# instead of being rebuilt through always_redraw.
+
+
+def _line_beziers(starts, ends):
+    # Straight cubic beziers (4 control points each) from starts[i] to ends[i]
+    handles = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    vects = (ends - starts)[:, None, :]
+    return (starts[:, None, :] + handles * vects).reshape(-1, 3)
+
+
+class AnalyticTangent(Line):
+    # Tangent segment placed from a closed-form derivative instead of a
+    # numeric lookup on the sampled curve. A single Line is moved in place.
+    def __init__(self, axes, func, deriv, x=0, length=1, **kwargs):
+        super().__init__(LEFT, RIGHT, **kwargs)
+        self.axes = axes
+        self.func = func
+        self.deriv = deriv
+        self.length = length
+        self.move_to_x(x)
+
+    def endpoints(self, xs):
+        # Direction (1, f'(x)) in axis coordinates, mapped to scene space and
+        # scaled to the segment length. Works on whole arrays of x at once.
+        _, x_unit, y_unit = axes_units(self.axes)
+        centers = axes_to_scene(self.axes)(xs, evaluate(self.func, xs))
+        dirs = x_unit + evaluate(self.deriv, xs)[..., None] * y_unit
+        dirs *= (self.length / 2) / np.linalg.norm(dirs, axis=-1)[..., None]
+        return centers - dirs, centers + dirs
+
+    def move_to_x(self, x):
+        start, end = self.endpoints(np.array([x]))
+        self.set_points_as_corners([start[0], end[0]])
+        return self
+
+
+class IncrementalArea(VMobject):
+    # Area between a graph and the x-axis from x_start up to a moving x.
+    # The sampled boundary is kept between frames, so moving right only
+    # samples the new slice and per-frame cost does not grow with the scan.
+    # With samples (a curve_sampler.SampledCurve on the same axes, covering
+    # the scan) the boundary reuses the plotted curve's adaptive samples.
+    def __init__(self, axes, func, x_start, dx=0.02, color=(BLUE, GREEN), opacity=0.3, samples=None, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.x_start = x_start
+        self.dx = dx
+        self.samples = samples
+        self.c2p = axes_to_scene(axes)
+        self.origin = self.c2p(x_start, 0)
+        if samples is not None:
+            inside = samples.xs > x_start
+            self._sample_xs = np.concatenate([[x_start], samples.xs[inside]])
+            self._sample_points = np.vstack([samples.point(x_start), samples.points[inside]])
+
+        # Boundary is sampled on the grid x_start + i * dx (or the curve's
+        # samples); segment 0 runs up from the axis and segment i joins
+        # samples i - 1 and i
+        self._beziers = np.zeros((4 * 64, 3))
+        self._num_samples = 0
+
+        self.extend_to(x_start)
+        # Styled like Axes.get_area
+        self.set_opacity(opacity).set_color(color)
+
+    def _reserve(self, num_segments):
+        if len(self._beziers) < 4 * num_segments:
+            grown = np.zeros((max(4 * num_segments, 2 * len(self._beziers)), 3))
+            grown[:len(self._beziers)] = self._beziers
+            self._beziers = grown
+
+    def _count(self, x):
+        # Samples at or left of x (always at least the x_start one)
+        if self.samples is None:
+            return max(int(np.floor((x - self.x_start) / self.dx + 1e-9)) + 1, 1)
+        return max(int(np.searchsorted(self._sample_xs, x, side="right")), 1)
+
+    def _points(self, n, m):
+        if self.samples is None:
+            xs = self.x_start + self.dx * np.arange(n, m)
+            return self.c2p(xs, evaluate(self.func, xs))
+        return self._sample_points[n:m]
+
+    def _edge(self, x):
+        if self.samples is None:
+            return self.c2p(x, evaluate(self.func, [x])[0])
+        return self.samples.point(x)
+
+    def extend_to(self, x):
+        n = self._num_samples
+        m = self._count(x)
+
+        if m > n:
+            # Only sample the new slice between the previous and current x
+            self._reserve(m + 3)
+            new_points = self._points(n, m)
+            prev = self._beziers[4 * n - 1] if n else self.origin
+            starts = np.vstack([prev[None, :], new_points[:-1]])
+            self._beziers[4 * n:4 * m] = _line_beziers(starts, new_points)
+        # Moving left just drops samples, they get re-evaluated if needed again
+        self._num_samples = m
+
+        # Closing edges: last sample -> f(x) -> axis at x -> axis at x_start
+        last = self._beziers[4 * m - 1]
+        edge = self._edge(x)
+        foot = self.c2p(x, 0)
+        self._beziers[4 * m:4 * (m + 3)] = _line_beziers(
+            np.array([last, edge, foot]), np.array([edge, foot, self.origin])
+        )
+        self.points = self._beziers[:4 * (m + 3)]
+        return self
+
+
+class BufferedTracedPath(VMobject):
+    # Drop-in TracedPath for long scans. Corners live in a preallocated
+    # buffer and points are appended in place. Collinear runs (like the
+    # straight 2x derivative line) collapse into one segment, and when the
+    # buffer is full every other corner is dropped, so memory and stroke
+    # cost stay bounded however long the scan runs. After each halving only
+    # every stride-th new corner is kept (the ones in between just move the
+    # loose end), so old and new parts of the path stay equally fine.
+    def __init__(
+        self, traced_point_func, stroke_width=2, stroke_color=WHITE,
+        max_points=1024, simplify=True, tolerance=1e-3, **kwargs
+    ):
+        super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, **kwargs)
+        self.traced_point_func = traced_point_func
+        self.max_points = max_points
+        self.simplify = simplify
+        self.tolerance = tolerance
+
+        self._corners = np.zeros((max_points, 3))
+        self._beziers = np.zeros((4 * max_points, 3))
+        self._num_corners = 0
+        self._run_direction = np.zeros(3)
+        # Corners are kept every stride-th new corner; the last one is loose
+        # until it lands on that grid
+        self._stride = 1
+        self._since = 0
+        self._loose_end = False
+        self.add_updater(self.update_path)
+
+    def update_path(self, mob):
+        self.append_point(self.traced_point_func())
+
+    def _set_segment(self, i):
+        # Segment i joins corners i and i + 1
+        self._beziers[4 * i:4 * i + 4] = _line_beziers(
+            self._corners[i:i + 1], self._corners[i + 1:i + 2]
+        )
+
+    def _is_collinear(self, point):
+        # Measured against the direction the run started with, so slow curves
+        # can't drift away one small turn at a time
+        a, b = self._corners[self._num_corners - 2:self._num_corners]
+        v = point - a
+        return (
+            np.dot(self._run_direction, v) > np.linalg.norm(b - a)
+            and np.linalg.norm(np.cross(self._run_direction, v)) <= self.tolerance * np.linalg.norm(v)
+        )
+
+    def _resample(self):
+        # Keep every other corner. An odd last corner is off the new grid and
+        # stays as the loose end, a stride (in new corners) past the one before
+        n = self._num_corners
+        keep = np.arange(0, n, 2)
+        self._loose_end = keep[-1] != n - 1
+        if self._loose_end:
+            keep = np.append(keep, n - 1)
+        self._corners[:len(keep)] = self._corners[keep]
+        self._num_corners = len(keep)
+        self._beziers[:4 * (len(keep) - 1)] = _line_beziers(
+            self._corners[:len(keep) - 1], self._corners[1:len(keep)]
+        )
+        self._since = self._stride if self._loose_end else 0
+        self._stride *= 2
+        # The run may have started at a dropped corner
+        self._run_direction = np.zeros(3)
+
+    def append_point(self, point):
+        point = np.asarray(point, dtype=float)
+        n = self._num_corners
+
+        if n and np.allclose(point, self._corners[n - 1]):
+            # Dot hasn't moved (e.g. during a wait)
+            return self
+        if n == 0:
+            self._corners[0] = point
+            self._beziers[:4] = point
+            self._num_corners = 1
+            self.points = self._beziers[:4]
+            return self
+
+        if self.simplify and n >= 2 and self._is_collinear(point):
+            # Slide the end of the last segment instead of adding a corner
+            self._corners[n - 1] = point
+            self._set_segment(n - 2)
+        else:
+            if not self._loose_end and n == self.max_points:
+                self._resample()
+                n = self._num_corners
+            if self._loose_end:
+                self._corners[n - 1] = point
+                self._set_segment(n - 2)
+            else:
+                self._corners[n] = point
+                self._set_segment(n - 1)
+                self._num_corners = n = n + 1
+            self._run_direction = normalize(point - self._corners[n - 2])
+            self._since += 1
+            self._loose_end = self._since % self._stride != 0
+            if not self._loose_end:
+                self._since = 0
+        self.points = self._beziers[:4 * (n - 1)]
+        return self
+
+
+class GlyphCounter(VMobject):
+    # DecimalNumber replacement for per-frame readouts. Digit, sign and point
+    # glyphs are rendered once per (font_size, color) and shared by every
+    # counter in the process. Each counter keeps one copy per slot and glyph,
+    # and set_value only swaps and repositions those cached submobjects.
+    _templates = {}
+
+    def __init__(self, number=0, num_decimal_places=2, font_size=DEFAULT_FONT_SIZE, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.font_size = font_size
+        self.glyph_color = color
+        # Same spacing rule as DecimalNumber
+        self.digit_buff = 0.001 * font_size
+        self._slots = {}
+        self.set_value(number)
+
+    def _template(self, char):
+        key = (char, self.font_size, str(self.glyph_color))
+        if key not in GlyphCounter._templates:
+            GlyphCounter._templates[key] = cached_mathtex(char, font_size=self.font_size, color=self.glyph_color)
+        return GlyphCounter._templates[key]
+
+    def _glyph(self, slot, char):
+        key = (slot, char)
+        if key not in self._slots:
+            self._slots[key] = self._template(char).copy()
+        return self._slots[key]
+
+    def get_value(self):
+        return self.number
+
+    def set_value(self, number):
+        self.number = number
+        string = f"{number:.{self.num_decimal_places}f}"
+        if string.startswith("-") and float(string) == 0:
+            string = string[1:]
+
+        anchor = self.get_left() if self.submobjects else None
+        digit = self._template("0")
+        x = 0
+        glyphs = []
+        for slot, char in enumerate(string):
+            glyph = self._glyph(slot, char)
+            width = glyph.width
+            if char == "-":
+                # Sign sits at the middle of the digit height
+                target = np.array([x + width / 2, digit.height / 2, 0])
+                glyph.shift(target - glyph.get_center())
+            else:
+                glyph.shift(np.array([x, 0, 0]) - glyph.get_corner(DL))
+            x += width + self.digit_buff
+            glyphs.append(glyph)
+        self.submobjects = glyphs
+
+        if anchor is not None:
+            self.move_to(anchor, aligned_edge=LEFT)
+        else:
+            self.center()
+        return self
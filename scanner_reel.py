@@ -0,0 +1,155 @@
+from manim import *
+import manim
+
+from curve_sampler import adaptive_plot
+from function_registry import scan_function
+from reel_template import ReelScene
+from scan_engine import ScanEngine
+from scan_mobjects import AnalyticTangent, GlyphCounter, IncrementalArea
+from tex_cache import cached_mathtex, cached_text
+from timeline import Timeline, load_spec
+
+# Scanner reels built from a spec in specs/ (see timeline.py). A reel is a
+# subclass naming its spec, e.g. DerivativeScannerReels; the spec is the
+# only definition of the reel, timeline.py renders the same class in chunks
+# or seeks to a single frame of it.
+
+def _color(name):
+    return getattr(manim, name) if isinstance(name, str) and name.isupper() else name
+
+
+def _number(value):
+    # Plain numbers or constant expressions like "2*pi"
+    if isinstance(value, (int, float)):
+        return float(value)
+    return scan_function(value)(0.0)
+
+
+def _fast_forward(scene, animations):
+    # Leaves the scene as if the animations had been played, without frames
+    for animation in animations:
+        animation._setup_scene(scene)
+        animation.begin()
+        animation.finish()
+        animation.clean_up_from_scene(scene)
+
+
+def _window(animation, start, stop, run_time, duration):
+    # Plays [start, stop] seconds of an animation of the given duration in a
+    # play of run_time: the play's alpha is mapped back to segment time
+    # before the animation applies its own rate function and lag
+    interpolate = animation.interpolate
+
+    def windowed(alpha):
+        t = stop if alpha >= 1 else start + alpha * run_time
+        interpolate(min(t / duration, 1.0))
+
+    animation.interpolate = windowed
+    return animation
+
+
+class SpecScannerReel(ReelScene):
+    spec_path = None
+    # (first frame, end frame) of the timeline to render, None for all
+    chunk = None
+
+    def build(self, spec, timeline):
+        # Mobjects of a "derivative" or "integral" scanner reel
+        colors = {name: _color(value) for name, value in spec["colors"].items()}
+        func = scan_function(spec["function"])
+        result = func.derivative() if spec["mode"] == "derivative" else func.antiderivative()
+
+        axes, labels = {}, []
+        for side, function in [("top", func), ("bottom", result)]:
+            layout = spec[side]
+            ax = Axes(
+                x_range=layout["x_range"], y_range=layout["y_range"],
+                x_length=layout["x_length"], y_length=layout["y_length"],
+                axis_config={"include_tip": True, "font_size": 24}
+            ).move_to(RIGHT * layout["center"][0] + UP * layout["center"][1])
+            label = layout["label"]
+            tex = function.label(label["name"]) + label.get("suffix", "")
+            color = colors["curve"] if side == "top" else colors["result"]
+            labels.append(
+                cached_mathtex(tex, color=color, font_size=label["font_size"]).next_to(ax, UP, buff=label["buff"])
+            )
+            axes[side] = ax
+        top, bottom = axes["top"], axes["bottom"]
+
+        title_spec = spec["title"]
+        title = cached_text(
+            title_spec["text"], font_size=title_spec["font_size"], weight=BOLD
+        ).to_edge(UP, buff=title_spec["buff"])
+        curve = adaptive_plot(top, func, x_range=spec["top"]["plot_range"], color=colors["curve"], stroke_width=4)
+
+        start, end = _number(spec["tracker"]["start"]), _number(spec["tracker"]["end"])
+        scan = next(segment for segment in timeline.segments if segment.kind == "scan")
+        self.tracker = ValueTracker(start)
+        self.scan_end = end
+        engine = ScanEngine(self.tracker, start, end, run_time=scan.num_frames / timeline.frame_rate)
+        func_points = engine.points(top, func)
+        result_points = engine.points(bottom, result)
+
+        dot_result = engine.follow(Dot(color=colors["result"], radius=0.12), result_points)
+        trace = engine.trace(result_points, stroke_color=colors["result"], stroke_width=5)
+        if spec["mode"] == "derivative":
+            dot_func = engine.follow(Dot(color=colors["scan"], radius=0.12), func_points)
+            marker = engine.tangent(AnalyticTangent(
+                top, func, result, x=start, length=spec.get("tangent_length", 3), color=colors["scan"]
+            ))
+            extra = [marker, dot_func]
+            counter_values, anchor, connector_start = engine.values(result), dot_func, func_points
+        else:
+            axis_points = engine.baseline(top)
+            area = IncrementalArea(top, func, x_start=start, color=colors["curve"], opacity=0.5, samples=curve.samples)
+            area.add_updater(lambda m: m.extend_to(self.tracker.get_value()), call_updater=True)
+            scan_line = engine.segment(Line(LEFT, RIGHT, color=colors["scan"], stroke_width=4), axis_points, func_points)
+            extra = [area, scan_line]
+            counter_values, anchor, connector_start = engine.values(result), dot_result, axis_points
+
+        counter_color = colors["scan"] if spec["mode"] == "derivative" else colors["result"]
+        counter = engine.number(GlyphCounter(0, num_decimal_places=2, color=counter_color, font_size=30), counter_values)
+        counter.add_updater(lambda m: m.next_to(anchor, UP, buff=0.2), call_updater=True)
+        connector = engine.dashed(connector_start, result_points, stroke_opacity=0.5, color=WHITE)
+
+        return VGroup(title, top, bottom, *labels, curve, *extra, dot_result, trace, counter, connector)
+
+    def segment_animations(self, segment):
+        if segment.kind == "scan":
+            animation = self.tracker.animate.set_value(self.scan_end).build()
+            animation.rate_func = linear
+            return [animation]
+        if segment.kind == "fade_out":
+            return [FadeOut(self.main_objects)]
+        if segment.kind == "outro":
+            return self.outro_animations(tuple(_color(c) for c in segment.params["gradient"]))
+        if segment.kind == "wait":
+            return []
+        raise ValueError(f"Unknown segment {segment.kind!r} in {self.spec_path}")
+
+    def construct(self):
+        spec = load_spec(self.spec_path)
+        timeline = Timeline(spec["timeline"], config.frame_rate)
+        self.add_watermark()
+        self.main_objects = self.build(spec, timeline)
+        self.add_layered(self.main_objects)
+
+        first, end = self.chunk or (0, timeline.num_frames)
+        before, windows = timeline.windows(first, end)
+        for segment in before:
+            _fast_forward(self, self.segment_animations(segment))
+
+        fps = timeline.frame_rate
+        for segment, start, num_frames in windows:
+            # Half a frame short so manim produces exactly num_frames frames
+            run_time = (num_frames - 0.5) / fps
+            if segment.kind == "wait":
+                self.wait(run_time, frozen_frame=False)
+                continue
+            # State after the window: the segment's end when it is played
+            # to the end, else the window's last frame
+            stop = segment.num_frames if start + num_frames == segment.num_frames else start + num_frames - 1
+            self.play(*[
+                _window(animation, start / fps, stop / fps, run_time, segment.num_frames / fps)
+                for animation in self.segment_animations(segment)
+            ], run_time=run_time)
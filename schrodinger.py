@@ -1,9 +1,11 @@
 from manim import *
 
+from tex_cache import cached_mathtex
+
 class Schrodinger(Scene):
     def construct(self):
         # Testing LaTeX rendering for physics
-        eq = MathTex(r"i\hbar \frac{\partial}{\partial t} \Psi = \hat{H} \Psi")
+        eq = cached_mathtex(r"i\hbar \frac{\partial}{\partial t} \Psi = \hat{H} \Psi")
         self.play(Write(eq))
         self.play(eq.animate.set_color(BLUE).scale(1.5))
         self.wait(2)
\ No newline at end of file
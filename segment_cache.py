@@ -0,0 +1,61 @@
+import glob
+import os
+
+# Segment-level render cache.
+# manim already hashes every play/wait call (camera, animations and mobject
+# state) and reuses the partial movie file of any segment whose hash it has
+# seen before, re-rendering only invalidated segments and re-stitching the
+# scene from the pieces. This module keeps that cache useful across our
+# edit-render loops: renders share one partial movie directory per scene,
+# manim.cfg lifts manim's small per-scene file limit, and eviction here is
+# least-recently-used by total size across every scene instead.
+
+DEFAULT_CACHE_MB = int(os.environ.get("REEL_SEGMENT_CACHE_MB", 4096))
+PARTIAL_LIST = "partial_movie_file_list.txt"
+
+
+def partial_movie_dirs(media_dir, scene="*"):
+    return glob.glob(os.path.join(media_dir, "**", "partial_movie_files", scene), recursive=True)
+
+
+def segment_files(media_dir, scene="*"):
+    return {
+        path for directory in partial_movie_dirs(media_dir, scene)
+        for path in glob.glob(os.path.join(directory, "*"))
+        if not path.endswith(PARTIAL_LIST)
+    }
+
+
+def touch_used_segments(media_dir, scene="*"):
+    # manim writes the segments that make up the last render of a scene to a
+    # concat list; mark those as recently used so eviction keeps them
+    used = 0
+    for directory in partial_movie_dirs(media_dir, scene):
+        listing = os.path.join(directory, PARTIAL_LIST)
+        if not os.path.exists(listing):
+            continue
+        with open(listing) as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith("file "):
+                    continue
+                path = line[len("file "):].strip("'")
+                if path.startswith("file:"):
+                    path = path[len("file:"):]
+                if os.path.exists(path):
+                    os.utime(path)
+                    used += 1
+    return used
+
+
+def evict_segments(media_dir, max_mb=DEFAULT_CACHE_MB):
+    files = sorted(segment_files(media_dir), key=os.path.getmtime)
+    total = sum(os.path.getsize(path) for path in files)
+    removed = 0
+    for path in files:
+        if total <= max_mb * 1024 * 1024:
+            break
+        total -= os.path.getsize(path)
+        os.remove(path)
+        removed += 1
+    return removed
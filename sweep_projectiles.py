@@ -0,0 +1,81 @@
+import argparse
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from render_options import QUALITIES, parse_values
+
+# Parameter sweep for ProjectileComparison.
+# Every combination of the swept parameters is rendered as its own variant
+# in a pool of worker processes. Each worker imports the scene once and
+# builds the shared assets (axes, labels, title and formula TeX) once, and
+# every variant it renders afterwards reuses them.
+#
+#   python sweep_projectiles.py --theta 15:75:15 --k 0.1,0.3,0.5 -q m
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _init_worker():
+    sys.path.insert(0, PROJECT_DIR)
+    import projectile_sim
+    from manim import GRAY, RED
+    from tex_cache import cached_mathtex, cached_text
+
+    # Warm the per-process caches before the first variant
+    projectile_sim.projectile_axes()
+    cached_text("Projectile Motion", font_size=48)
+    cached_text("Vacuum vs. Air Resistance", font_size=36, color=GRAY)
+    cached_mathtex(r"\vec{F}_d = -k \vec{v}", color=RED)
+
+
+def render_variant(params, quality, media_dir):
+    import projectile_sim
+    from manim import tempconfig
+
+    scene_class = projectile_sim.projectile_variant(**params)
+    start = time.perf_counter()
+    with tempconfig({"quality": QUALITIES[quality], "media_dir": media_dir, "output_file": scene_class.__name__}):
+        scene_class().render()
+    return scene_class.__name__, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a parameter sweep of ProjectileComparison.")
+    parser.add_argument("--v0", type=parse_values)
+    parser.add_argument("--theta", type=parse_values, help="launch angles in degrees")
+    parser.add_argument("--g", type=parse_values)
+    parser.add_argument("--k", type=parse_values, help="drag coefficients")
+    parser.add_argument("-q", "--quality", default="m", choices=QUALITIES)
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--memory-mb", type=float, default=8000, help="total memory budget for the workers")
+    parser.add_argument("--estimate-mb", type=float, default=1000, help="assumed peak memory of one worker")
+    parser.add_argument("--media-dir", default=os.path.join(PROJECT_DIR, "media"))
+    args = parser.parse_args()
+
+    swept = {
+        name: values for name, values in
+        [("v0", args.v0), ("theta_degrees", args.theta), ("g", args.g), ("k", args.k)]
+        if values
+    }
+    variants = [dict(zip(swept, combo)) for combo in itertools.product(*swept.values())]
+    workers = max(1, min(args.workers, int(args.memory_mb // args.estimate_mb), len(variants)))
+
+    print(f"Rendering {len(variants)} variants on {workers} workers")
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(render_variant, params, args.quality, args.media_dir): params for params in variants}
+        for future in as_completed(futures):
+            try:
+                name, wall_time = future.result()
+                print(f"{name:48s} {wall_time:8.1f}s")
+            except Exception as error:
+                failed += 1
+                print(f"{futures[future]} failed: {error}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from curve_sampler import adaptive_samples
+
+SCALE = 120.0
+
+
+def c2p(xs, ys):
+    # Axes with 1.5 units per x and 0.8 per y
+    return np.stack([1.5 * xs, 0.8 * ys, np.zeros_like(xs)], axis=1)
+
+
+def chord_error_px(func, xs, points, per_interval=32):
+    # Largest distance in pixels between the curve and the polyline
+    worst = 0.0
+    for (a, b), (p, q) in zip(zip(xs, xs[1:]), zip(points, points[1:])):
+        s = np.linspace(0, 1, per_interval)
+        curve = c2p(a + s * (b - a), func(a + s * (b - a)))
+        chord = p + s[:, None] * (q - p)
+        worst = max(worst, np.linalg.norm(curve - chord, axis=1).max() * SCALE)
+    return worst
+
+
+@pytest.mark.parametrize("tolerance", [0.25, 0.5, 2.0])
+def test_polyline_within_tolerance(tolerance):
+    xs, ys, points = adaptive_samples(np.sin, c2p, -4, 6.5, tolerance_px=tolerance, scale=SCALE)
+    assert np.all(np.diff(xs) > 0)
+    np.testing.assert_allclose(ys, np.sin(xs))
+    # Refinement checks interval midpoints, the chord error of a smooth
+    # curve peaks close to them
+    assert chord_error_px(np.sin, xs, points) <= tolerance * 1.05
+
+
+def test_tighter_tolerance_needs_more_samples():
+    coarse = adaptive_samples(np.sin, c2p, -4, 6.5, tolerance_px=2.0, scale=SCALE)[0]
+    fine = adaptive_samples(np.sin, c2p, -4, 6.5, tolerance_px=0.25, scale=SCALE)[0]
+    assert len(fine) > len(coarse)
+
+
+def test_straight_line_is_not_refined():
+    xs, _, _ = adaptive_samples(lambda x: 2 * x + 1, c2p, -3, 3, scale=SCALE, initial=16)
+    assert len(xs) == 17
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sympy")
+
+from function_registry import FunctionRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return FunctionRegistry(directory=str(tmp_path))
+
+
+def test_derivative_and_antiderivative(registry):
+    xs = np.linspace(-3, 3, 13)
+    f = registry.function("x**3 - 2*x")
+    np.testing.assert_allclose(f.derivative()(xs), 3 * xs**2 - 2)
+    np.testing.assert_allclose(f.antiderivative()(xs), xs**4 / 4 - xs**2)
+    np.testing.assert_allclose(registry.function("sin(x)").antiderivative()(xs), -np.cos(xs))
+
+
+def test_constant_broadcasts(registry):
+    derivative = registry.function("5*x").derivative()
+    xs = np.linspace(0, 1, 7)
+    np.testing.assert_array_equal(derivative(xs), np.full(7, 5.0))
+    assert derivative(2.0) == 5.0
+
+
+def test_label(registry):
+    assert registry.function("x**2").label("f") == "f(x) = x^{2}"
+
+
+def test_no_closed_form(registry):
+    with pytest.raises(ValueError, match="no closed-form antiderivative"):
+        registry.function("x**x").antiderivative()
+
+
+def test_warm_load_reuses_cached_entry(registry, tmp_path):
+    registry.function("x**2").derivative()
+    warm = FunctionRegistry(directory=str(tmp_path))
+    entry = warm._load(warm.key("x**2", "x"))
+    assert entry["derivative"] == "2*x"
+    np.testing.assert_allclose(warm.function("x**2").derivative()(3.0), 6.0)
@@ -0,0 +1,58 @@
+from fractions import Fraction
+
+import pytest
+
+from gaussian_solver import back_substitute, eliminate, to_latex
+
+
+def solve(matrix, partial_pivot=True):
+    ops, triangular = eliminate(matrix, partial_pivot)
+    steps, solution = back_substitute(triangular)
+    return ops, solution
+
+
+def test_exact_fractions():
+    # x + 2y = 1, 3x + 4y = 2: x = 0, y = 1/2
+    ops, solution = solve([[1, 2, 1], [3, 4, 2]])
+    assert solution == [Fraction(0), Fraction(1, 2)]
+    assert all(isinstance(value, Fraction) for value in solution)
+
+
+def test_three_by_three():
+    matrix = [[2, 1, -1, 8], [-3, -1, 2, -11], [-2, 1, 2, -3]]
+    _, solution = solve(matrix)
+    assert solution == [2, 3, -1]
+
+
+def test_partial_pivot_swaps_largest_entry_up():
+    ops, _ = solve([[1, 2, 1], [3, 4, 2]])
+    assert ops[0].kind == "swap"
+    assert (ops[0].target, ops[0].source) == (0, 1)
+    assert ops[0].matrix[0] == [3, 4, 2]
+
+
+def test_zero_pivot_swaps_without_partial_pivot():
+    ops, solution = solve([[0, 1, 2], [1, 1, 3]], partial_pivot=False)
+    assert [op.kind for op in ops] == ["swap"]
+    assert solution == [1, 2]
+
+
+def test_no_swap_when_pivot_is_nonzero():
+    ops, _ = solve([[1, 2, 1], [3, 4, 2]], partial_pivot=False)
+    assert [op.kind for op in ops] == ["eliminate"]
+    assert ops[0].factor == 3
+
+
+def test_singular_raises():
+    with pytest.raises(ValueError, match="no unique solution"):
+        eliminate([[1, 2, 3], [2, 4, 6]])
+
+
+def test_shape_is_checked():
+    with pytest.raises(ValueError):
+        eliminate([[1, 2], [3, 4]])
+
+
+def test_latex():
+    assert to_latex(Fraction(-3, 4)) == r"-\frac{3}{4}"
+    assert to_latex(Fraction(6, 3)) == "2"
@@ -0,0 +1,23 @@
+import pytest
+
+from render_all import shard_ranges
+
+
+@pytest.mark.parametrize("num_animations, shards", [(10, 3), (9, 4), (7, 2), (100, 8), (2, 1)])
+def test_shards_cover_every_animation_once(num_animations, shards):
+    ranges = shard_ranges(num_animations, shards)
+    assert [index for index, _, _ in ranges] == list(range(len(ranges)))
+    assert ranges[0][1] == 0 and ranges[-1][2] == num_animations - 1
+    assert all(end + 1 == start for (_, _, end), (_, start, _) in zip(ranges, ranges[1:]))
+
+
+def test_first_shard_ends_after_animation_zero():
+    # manim reads upto_animation_number 0 as unset
+    for num_animations in range(2, 30):
+        for shards in range(1, 12):
+            assert shard_ranges(num_animations, shards)[0][2] >= 1
+
+
+def test_shards_are_capped():
+    assert len(shard_ranges(5, 10)) == 2
+    assert shard_ranges(1, 4) == [(0, 0, 0)]
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from timeline import Timeline, load_spec
+
+SPECS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "specs")
+ENTRIES = [
+    {"play": "scan", "run_time": 2},
+    {"wait": 0.5},
+    {"play": "outro", "run_time": 1.01},
+]
+
+
+@pytest.fixture
+def timeline():
+    return Timeline(ENTRIES, 30)
+
+
+def test_segments_start_on_frames(timeline):
+    assert [(s.kind, s.start, s.num_frames) for s in timeline.segments] == [
+        ("scan", 0, 60), ("wait", 60, 15), ("outro", 75, 30),
+    ]
+    assert timeline.num_frames == 105
+
+
+def test_frame_and_time(timeline):
+    assert timeline.frame(2.0) == 60
+    assert timeline.time(60) == 2.0
+    assert timeline.frame(-1) == 0
+    assert timeline.frame(100) == timeline.num_frames - 1
+
+
+@pytest.mark.parametrize("count", [1, 2, 4, 7, 200])
+def test_chunks_cover_every_frame_once(timeline, count):
+    chunks = timeline.chunks(count)
+    assert chunks[0][0] == 0 and chunks[-1][1] == timeline.num_frames
+    assert all(a < b for a, b in chunks)
+    assert all(end == start for (_, end), (start, _) in zip(chunks, chunks[1:]))
+
+
+def test_windows(timeline):
+    before, windows = timeline.windows(50, 80)
+    assert before == []
+    assert [(s.kind, start, frames) for s, start, frames in windows] == [
+        ("scan", 50, 10), ("wait", 0, 15), ("outro", 0, 5),
+    ]
+    before, windows = timeline.windows(75, 76)
+    assert [s.kind for s in before] == ["scan", "wait"]
+    assert [(s.kind, start, frames) for s, start, frames in windows] == [("outro", 0, 1)]
+
+
+@pytest.mark.parametrize("name", ["derivative_scanner.json", "integration_scanner.json"])
+def test_specs_compile(name):
+    spec = load_spec(os.path.join(SPECS_DIR, name))
+    timeline = Timeline(spec["timeline"], 60)
+    assert sum(s.num_frames for s in timeline.segments) == timeline.num_frames
+    assert [s.kind for s in timeline.segments].count("scan") == 1
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from trajectory import simulate_trajectories
+
+G = 9.8
+
+
+def test_vacuum_range_and_flight_time():
+    v0 = np.array([10.0, 20.0, 30.0])
+    theta = np.radians([30.0, 45.0, 60.0])
+    result = simulate_trajectories(v0, theta, g=G, k=0.0)
+    np.testing.assert_allclose(result.ranges(), v0**2 * np.sin(2 * theta) / G, rtol=1e-6)
+    np.testing.assert_allclose(result.impact_times, 2 * v0 * np.sin(theta) / G, rtol=1e-6)
+
+
+def test_linear_drag_matches_closed_form():
+    v0, theta, k = 25.0, np.radians(50.0), 0.4
+    result = simulate_trajectories(v0, theta, g=G, k=k, drag="linear")
+    vx, vy = v0 * np.cos(theta), v0 * np.sin(theta)
+    flying = result.times < result.impact_times[0]
+    t = result.times[flying]
+    decay = 1 - np.exp(-k * t)
+    x = vx / k * decay
+    y = (vy + G / k) / k * decay - G * t / k
+    np.testing.assert_allclose(result.positions[0, flying], np.stack([x, y], axis=1), atol=1e-6)
+    assert result.impact_points[0, 1] == 0
+
+
+def test_positions_stay_at_impact_point():
+    result = simulate_trajectories([5.0, 15.0], np.radians(45.0))
+    landed_early = result.times > result.impact_times[0]
+    assert landed_early.any()
+    assert (result.positions[0, landed_early] == result.impact_points[0]).all()
+
+
+def test_unknown_drag_model():
+    with pytest.raises(ValueError, match="drag model"):
+        simulate_trajectories(10.0, 0.5, k=0.1, drag="cubic")
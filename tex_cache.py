@@ -0,0 +1,159 @@
+from manim import *
+import atexit
+import hashlib
+import json
+import os
+import pickle
+from functools import lru_cache
+
+# Persistent cache for MathTex / Tex / Text.
+# Compiled mobjects are stored by a content hash of the source strings, the
+# keyword arguments (font size, color, font, ...), the TeX template and the
+# manim and Pango versions. Entries are the pickled mobjects themselves, so a
+# warm render gets the same class with the same attributes and submobject
+# layout as a cold one (tex_strings, get_part_by_tex, indexing into parts)
+# while skipping LaTeX, Pango and SVG parsing entirely. Entries that vanish
+# or can't be read (another render evicting them, a changed class) count as
+# misses.
+
+CACHE_DIR = os.environ.get(
+    "REEL_TEX_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "think_nebulae", "tex")
+)
+MAX_CACHE_BYTES = int(os.environ.get("REEL_TEX_CACHE_BYTES", 256 * 1024 * 1024))
+# Bumped when the stored layout changes, old entries just age out
+FORMAT_VERSION = 3
+
+
+@lru_cache(maxsize=None)
+def _toolchain():
+    import manim
+    import manimpango
+
+    return manim.__version__, manimpango.pango_version()
+
+
+class TexCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Bytes stored since the last eviction pass
+        self.written = 0
+        # Mobjects already loaded in this process, handed out as copies
+        self._memory = {}
+
+    def key(self, kind, strings, kwargs):
+        template = kwargs.get("tex_template") or (config.tex_template if kind != "text" else None)
+        payload = json.dumps([
+            FORMAT_VERSION,
+            *_toolchain(),
+            kind,
+            list(strings),
+            # "" is Pango's default font, spelled out so it is always keyed
+            kwargs.get("font", "") if kind == "text" else None,
+            sorted((name, str(value)) for name, value in kwargs.items() if name != "tex_template"),
+            getattr(template, "body", None),
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _store(self, key, mob):
+        path = self._path(key)
+        try:
+            data = pickle.dumps(mob, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Not cacheable, built again next time
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Atomic write, parallel renders may store the same entry at once
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self.written += len(data)
+        # Walking the cache is slow, only done after a sixteenth of it was
+        # written (and at exit)
+        if self.written > self.max_bytes // 16:
+            self.evict()
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                mob = pickle.load(f)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        return mob
+
+    def evict(self):
+        # Least recently used entries go first (hits touch the files). Other
+        # renders may remove files while this one walks the cache
+        self.written = 0
+        entries = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                key = name.split(".")[0]
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                # Every file of the key, older formats included
+                size, mtime, paths = entries.get(key, (0, 0, []))
+                entries[key] = (size + stat.st_size, max(mtime, stat.st_mtime), paths + [path])
+
+        total = sum(size for size, _, _ in entries.values())
+        for key, (size, _, paths) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+    def get(self, kind, build, strings, kwargs):
+        key = self.key(kind, strings, kwargs)
+        if key not in self._memory:
+            mob = self._load(key)
+            if mob is None:
+                self.misses += 1
+                mob = build(*strings, **kwargs)
+                self._store(key, mob)
+            else:
+                self.hits += 1
+            self._memory[key] = mob
+        else:
+            self.hits += 1
+        return self._memory[key].copy()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+
+tex_cache = TexCache()
+
+
+def cached_mathtex(*tex_strings, **kwargs):
+    return tex_cache.get("mathtex", MathTex, tex_strings, kwargs)
+
+
+def cached_tex(*tex_strings, **kwargs):
+    return tex_cache.get("tex", Tex, tex_strings, kwargs)
+
+
+def cached_text(text, **kwargs):
+    return tex_cache.get("text", Text, (text,), kwargs)
+
+
+@atexit.register
+def _report():
+    if tex_cache.written:
+        tex_cache.evict()
+    if tex_cache.hits or tex_cache.misses:
+        logger.info(f"TeX cache: {tex_cache.hits} hits, {tex_cache.misses} misses")
@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from render_all import concat_movies
+from render_options import QUALITIES
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Declarative scanner reels.
+# A spec (JSON, or YAML when PyYAML is installed) describes the axes, the
+# function, the scan tracker and the play segments of a scanner reel; see
+# specs/. The segments compile to a frame-indexed Timeline. Every element of
+# a scanner reel is derived from the tracker value (dots, tangent, area,
+# counter and the trace), so any frame range can be rendered on its own:
+# segments before it are fast-forwarded without drawing a frame, and the
+# segments it overlaps are played over just that window. That makes chunks
+# renderable in parallel and single frames instant to seek to. The scene
+# class is SpecScannerReel in scanner_reel.py, which the scanner reels
+# (DerivativeScannerReels, IntegrationScannerSin) subclass with their spec.
+#
+#   python timeline.py specs/derivative_scanner.json --chunks 4 -q h
+#   python timeline.py specs/integration_scanner.json --seek 14.5
+#   python timeline.py specs/integration_scanner.json --info
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_spec(path):
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError(f"PyYAML is needed to read {path} (pip install pyyaml), or use a .json spec")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+# --- Timeline ---
+
+class Segment:
+    def __init__(self, kind, start, num_frames, params):
+        # kind is "wait" or the name of a play ("scan", "fade_out", "outro")
+        self.kind = kind
+        self.start = start
+        self.num_frames = num_frames
+        self.params = params
+
+    @property
+    def end(self):
+        return self.start + self.num_frames
+
+    def __repr__(self):
+        return f"Segment({self.kind!r}, frames {self.start}-{self.end})"
+
+
+class Timeline:
+    def __init__(self, entries, frame_rate):
+        self.frame_rate = frame_rate
+        self.segments = []
+        frame = 0
+        for entry in entries:
+            if "wait" in entry:
+                kind, duration = "wait", entry["wait"]
+            else:
+                kind, duration = entry["play"], entry["run_time"]
+            # Segments start on frames, so any split of the timeline is exact
+            num_frames = int(round(duration * frame_rate))
+            self.segments.append(Segment(kind, frame, num_frames, entry))
+            frame += num_frames
+        self.num_frames = frame
+
+    def time(self, frame):
+        return frame / self.frame_rate
+
+    def frame(self, t):
+        return min(max(int(round(t * self.frame_rate)), 0), self.num_frames - 1)
+
+    def chunks(self, count):
+        bounds = [round(i * self.num_frames / count) for i in range(count + 1)]
+        return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+    def windows(self, first, end):
+        # (segment, first local frame, frames) for every segment overlapping
+        # [first, end), and the segments entirely before first
+        before, windows = [], []
+        for segment in self.segments:
+            if segment.end <= first:
+                before.append(segment)
+            elif segment.start < end:
+                start = max(first, segment.start) - segment.start
+                windows.append((segment, start, min(end, segment.end) - segment.start - start))
+        return before, windows
+
+
+def spec_scene(spec_path, chunk=None):
+    # Imported here, so reading specs and timelines doesn't import manim
+    from scanner_reel import SpecScannerReel
+
+    spec = load_spec(spec_path)
+    name = spec.get("name") or os.path.splitext(os.path.basename(spec_path))[0]
+    return type(name, (SpecScannerReel,), {"spec_path": os.path.abspath(spec_path), "chunk": chunk})
+
+
+# --- Rendering ---
+
+def render_chunk(spec_path, chunk, index, quality, media_dir):
+    sys.path.insert(0, PROJECT_DIR)
+    from manim import tempconfig
+
+    scene_class = spec_scene(spec_path, chunk)
+    with tempconfig({
+        "quality": QUALITIES[quality], "media_dir": media_dir,
+        "output_file": f"{scene_class.__name__}_chunk{index:03d}",
+    }):
+        scene = scene_class()
+        scene.render()
+        return scene.renderer.file_writer.movie_file_path
+
+
+def seek_frame(spec_path, t, quality, media_dir):
+    # One frame as a PNG, without playing anything before it
+    from manim import config, tempconfig
+
+    with tempconfig({"quality": QUALITIES[quality], "media_dir": media_dir}):
+        spec = load_spec(spec_path)
+        frame = Timeline(spec["timeline"], config.frame_rate).frame(t)
+        scene_class = spec_scene(spec_path, (frame, frame + 1))
+        with tempconfig({
+            "write_to_movie": False, "save_last_frame": True, "disable_caching": True,
+            "output_file": f"{scene_class.__name__}_frame{frame:05d}",
+        }):
+            scene = scene_class()
+            scene.render()
+            return scene.renderer.file_writer.image_file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a declarative scanner reel spec.")
+    parser.add_argument("spec", help="specs/*.json (or .yaml)")
+    parser.add_argument("-q", "--quality", default="h", choices=QUALITIES)
+    parser.add_argument("--chunks", type=int, default=1, help="render this many frame ranges in parallel")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--media-dir", default=os.path.join(PROJECT_DIR, "media"))
+    parser.add_argument("--seek", type=float, metavar="SECONDS", help="render only the frame at this time")
+    parser.add_argument("--info", action="store_true", help="print the compiled timeline")
+    args = parser.parse_args()
+
+    sys.path.insert(0, PROJECT_DIR)
+    from manim import tempconfig
+
+    if args.seek is not None:
+        print(seek_frame(args.spec, args.seek, args.quality, args.media_dir))
+        return
+
+    spec = load_spec(args.spec)
+    with tempconfig({"quality": QUALITIES[args.quality]}):
+        from manim import config
+
+        timeline = Timeline(spec["timeline"], config.frame_rate)
+    if args.info:
+        for segment in timeline.segments:
+            print(f"{segment.kind:10s} frames {segment.start:6d}-{segment.end:6d}  "
+                  f"{timeline.time(segment.start):7.2f}s-{timeline.time(segment.end):7.2f}s")
+        return
+
+    chunks = timeline.chunks(max(1, args.chunks))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(chunks)))) as pool:
+        movies = list(pool.map(
+            render_chunk, [args.spec] * len(chunks), chunks, range(len(chunks)),
+            [args.quality] * len(chunks), [args.media_dir] * len(chunks)
+        ))
+
+    name = spec_scene(args.spec).__name__
+    output = os.path.join(args.media_dir, "videos", "specs", f"{name}.mp4")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    if len(movies) > 1:
+        concat_movies(movies, output)
+    else:
+        os.replace(str(movies[0]), output)
+    print(f"{output}: {timeline.num_frames} frames in {len(chunks)} chunks, {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from manim import *
+import numpy as np
+
+from scan_engine import axes_to_scene
+
+# Numerical trajectory engine for the projectile reels.
+# Integrates many launches at once with a fixed-step RK4 that is vectorized
+# over launches (the Python loop only runs over time steps). Supports linear
+# and quadratic drag, horizontal wind and per-launch parameters, and finds
+# the ground impact of each launch by root-finding on the cubic Hermite
+# interpolant of the step that crosses y = 0.
+
+
+class Trajectories:
+    def __init__(self, times, positions, impact_times, impact_points):
+        self.times = times
+        # (launches, steps, 2); positions after impact stay at the impact point
+        self.positions = positions
+        self.impact_times = impact_times
+        self.impact_points = impact_points
+
+    def __len__(self):
+        return len(self.positions)
+
+    def points(self, i):
+        # Dense (x, y) samples of launch i, ending exactly at its impact point
+        flying = self.times < self.impact_times[i]
+        return np.vstack([self.positions[i, flying], self.impact_points[i]])
+
+    def ranges(self):
+        return self.impact_points[:, 0]
+
+
+def _acceleration(vel, g, k, wind, drag):
+    rel = vel - wind
+    if drag == "linear":
+        acc = -k[:, None] * rel
+    elif drag == "quadratic":
+        acc = -k[:, None] * np.linalg.norm(rel, axis=1)[:, None] * rel
+    else:
+        raise ValueError(f"Unknown drag model {drag!r}, expected 'linear' or 'quadratic'")
+    acc[:, 1] -= g
+    return acc
+
+
+def _hermite_root(p0, v0, p1, v1, dt, iterations=40):
+    # Time in [0, dt] where the cubic Hermite height crosses 0, by bisection
+    # (the height is > 0 at the start of the step and <= 0 at the end)
+    def height(s):
+        h00, h10 = 2 * s**3 - 3 * s**2 + 1, s**3 - 2 * s**2 + s
+        h01, h11 = -2 * s**3 + 3 * s**2, s**3 - s**2
+        return h00 * p0 + h10 * dt * v0 + h01 * p1 + h11 * dt * v1
+
+    lo, hi = np.zeros_like(p0), np.ones_like(p0)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        above = height(mid) > 0
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    return hi * dt
+
+
+def simulate_trajectories(v0, theta, g=9.8, k=0.0, drag="linear", wind=0.0, dt=1 / 240, t_max=20.0):
+    # v0, theta (radians), k and wind (horizontal air speed) broadcast
+    # against each other, one launch per element
+    v0, theta, k, wind_x = (np.asarray(a, dtype=float) for a in np.broadcast_arrays(
+        np.atleast_1d(v0), theta, k, wind
+    ))
+    n = len(v0)
+    wind = np.stack([wind_x, np.zeros(n)], axis=1)
+
+    num_steps = int(np.ceil(t_max / dt))
+    times = np.arange(num_steps + 1) * dt
+    positions = np.zeros((n, num_steps + 1, 2))
+    pos = np.zeros((n, 2))
+    vel = np.stack([v0 * np.cos(theta), v0 * np.sin(theta)], axis=1)
+
+    impact_times = np.full(n, np.inf)
+    impact_points = np.full((n, 2), np.nan)
+    flying = np.ones(n, dtype=bool)
+
+    def accel(v):
+        return _acceleration(v, g, k, wind, drag)
+
+    for step in range(1, num_steps + 1):
+        # Classic RK4 on (position, velocity)
+        a1 = accel(vel)
+        a2 = accel(vel + dt / 2 * a1)
+        a3 = accel(vel + dt / 2 * a2)
+        a4 = accel(vel + dt * a3)
+        new_pos = pos + dt / 6 * (vel + 2 * (vel + dt / 2 * a1) + 2 * (vel + dt / 2 * a2) + (vel + dt * a3))
+        new_vel = vel + dt / 6 * (a1 + 2 * a2 + 2 * a3 + a4)
+
+        landed = flying & (new_pos[:, 1] <= 0)
+        if landed.any():
+            t_hit = _hermite_root(
+                pos[landed, 1], vel[landed, 1], new_pos[landed, 1], new_vel[landed, 1], dt
+            )
+            s = t_hit / dt
+            h00, h10 = 2 * s**3 - 3 * s**2 + 1, s**3 - 2 * s**2 + s
+            h01, h11 = -2 * s**3 + 3 * s**2, s**3 - s**2
+            x_hit = (
+                h00 * pos[landed, 0] + h10 * dt * vel[landed, 0]
+                + h01 * new_pos[landed, 0] + h11 * dt * new_vel[landed, 0]
+            )
+            impact_times[landed] = times[step - 1] + t_hit
+            impact_points[landed] = np.stack([x_hit, np.zeros_like(x_hit)], axis=1)
+            flying &= ~landed
+
+        pos = np.where(flying[:, None], new_pos, pos)
+        vel = np.where(flying[:, None], new_vel, vel)
+        positions[:, step] = np.where(flying[:, None], pos, impact_points)
+        if not flying.any():
+            times = times[:step + 1]
+            positions = positions[:, :step + 1]
+            break
+
+    # Launches still in the air at t_max end where they are
+    impact_times[flying] = times[-1]
+    impact_points[flying] = pos[flying]
+    return Trajectories(times, positions, impact_times, impact_points)
+
+
+def trajectory_path(axes, trajectories, i):
+    # Invisible path through launch i's dense samples, for MoveAlongPath
+    points = trajectories.points(i)
+    path = VMobject(fill_opacity=0, stroke_opacity=0)
+    path.set_points_as_corners(axes_to_scene(axes)(points[:, 0], points[:, 1]))
+    return path